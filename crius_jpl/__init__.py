@@ -5,27 +5,44 @@ Named after Crius, the Titan of constellations and measuring the year.
 """
 
 from .adapter import JplEphemerisAdapter
-from .service import create_jpl_adapter, calc_positions
+from .service import create_jpl_adapter, calc_positions, set_default_ephemeris_path
+from .settings import JplSettings, JplLocation
 from .exceptions import (
     CriusJplError,
     EphemerisDownloadError,
     DateRangeError,
     EphemerisLoadError,
 )
-from .validation import validate_date_range, check_date_range, JPL_MIN_DATE, JPL_MAX_DATE
+from ._ephemeris_cache import load_ephemeris_to_cache
+from .validation import (
+    validate_date_range,
+    validate_jd_range,
+    check_date_range,
+    JPL_MIN_DATE,
+    JPL_MAX_DATE,
+    JPL_MIN_JD,
+    JPL_MAX_JD,
+)
 
 __all__ = [
     "JplEphemerisAdapter",
     "create_jpl_adapter",
     "calc_positions",
+    "set_default_ephemeris_path",
+    "load_ephemeris_to_cache",
+    "JplSettings",
+    "JplLocation",
     "CriusJplError",
     "EphemerisDownloadError",
     "DateRangeError",
     "EphemerisLoadError",
     "validate_date_range",
+    "validate_jd_range",
     "check_date_range",
     "JPL_MIN_DATE",
     "JPL_MAX_DATE",
+    "JPL_MIN_JD",
+    "JPL_MAX_JD",
 ]
 
 __version__ = "0.1.0"
@@ -0,0 +1,71 @@
+"""
+Download registry for the JPL kernels used by crius-jpl.
+
+A kernel that skyfield has already downloaded (into its load directory) is
+always used as is. Otherwise, when the optional ``pooch`` dependency is
+installed (``pip install crius-jpl[pooch]``), kernels are fetched into a
+per-user cache directory with optional hash verification and atomic
+replacement, so a partial download never ends up on disk. Without pooch,
+callers fall back to skyfield's built-in downloader.
+"""
+
+import functools
+import os
+from typing import Optional
+
+from skyfield.api import load
+
+try:
+    import pooch
+except ImportError:  # pragma: no cover - optional dependency
+    pooch = None
+
+# JPL DE430t kernel (same source skyfield downloads from)
+DE430T_FILENAME = "de430t.bsp"
+KERNEL_BASE_URL = "https://ssd.jpl.nasa.gov/ftp/eph/planets/bsp/"
+
+# Known hash for verification, e.g. "sha256:<hex>". None disables verification
+# (no hash is pinned yet); set CRIUS_JPL_DE430T_HASH to the hash of a trusted
+# copy to have every pooch download checked against it.
+DE430T_HASH: Optional[str] = os.getenv("CRIUS_JPL_DE430T_HASH") or None
+
+# Cache location can be overridden with CRIUS_JPL_DATA_DIR (e.g. for container builds)
+POOCH = (
+    pooch.create(
+        path=pooch.os_cache("crius_jpl"),
+        base_url=KERNEL_BASE_URL,
+        registry={DE430T_FILENAME: DE430T_HASH},
+        env="CRIUS_JPL_DATA_DIR",
+    )
+    if pooch is not None
+    else None
+)
+
+
+def kernel_url(filename: str = DE430T_FILENAME) -> str:
+    """Return the download URL for a registered kernel."""
+    return KERNEL_BASE_URL + filename
+
+
+@functools.cache
+def fetch_kernel(filename: str = DE430T_FILENAME) -> Optional[str]:
+    """
+    Return a local path to a registered kernel, fetching it into the cache if needed.
+    
+    A copy that skyfield has already downloaded is preferred, so existing
+    installs keep working offline and the kernel is not downloaded twice.
+    Successful fetches are memoized for the life of the process, since pooch
+    re-hashes the whole file on every fetch when a hash is pinned.
+
+    Args:
+        filename: Kernel filename from the registry (default: de430t.bsp)
+
+    Returns:
+        Local path to the kernel, or None if it is not on disk and pooch is not installed
+    """
+    skyfield_path = str(load.path_to(filename))
+    if os.path.exists(skyfield_path):
+        return skyfield_path
+    if POOCH is None:
+        return None
+    return str(POOCH.fetch(filename))
@@ -0,0 +1,287 @@
+"""
+Two-tier cache of computed planet positions.
+
+Positions are keyed on (planet ID, TT Julian Date rounded to 6 decimals, about
+0.1 s) and stored as (lon, lat, speed_lon, retrograde) tuples, grouped by TT
+calendar day:
+
+- an in-memory tier holding the day tables of the most recently used days, and
+- an on-disk tier with one JSON file per day (``YYYY-MM-DD.json``), loaded
+  into memory on first access to that day.
+
+Repeat queries for the same instants (today's transits, a week of transits)
+therefore skip the JPL evaluation, including across processes.
+
+New positions only go to memory; a changed day is written back when it is
+evicted, when the cache is flushed or closed (prewarm() and interpreter exit),
+and at most every ``FLUSH_INTERVAL`` seconds otherwise, so cold calculations
+do not rewrite day files. Day files are serialized outside the lookup lock, so
+a write never stalls other lookups, and each day holds at most
+``MAX_DAY_ROWS`` positions (further instants are computed but not cached),
+which bounds both the day files and the memory tier. Day files hold plain
+JSON rather than pickles, so a shared cache directory cannot be used to run
+code, and unreadable files are treated as empty.
+
+The cache directory is the ``cache_dir`` passed to the adapter, else the
+``CRIUS_JPL_CACHE_DIR`` environment variable, else ``eph`` in the per-user
+cache directory. Set ``CRIUS_JPL_CACHE_DISABLE=1`` to turn off the default
+location (an explicit ``cache_dir`` still enables the cache).
+"""
+
+import atexit
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Iterable, Optional, Sequence
+
+try:
+    from platformdirs import user_cache_dir
+except ImportError:  # pragma: no cover - optional dependency
+    user_cache_dir = None  # type: ignore[assignment]
+
+CACHE_DIR_ENV = "CRIUS_JPL_CACHE_DIR"
+CACHE_DISABLE_ENV = "CRIUS_JPL_CACHE_DISABLE"
+
+# Bump when the stored value layout or calculation method changes; day files
+# written with another version are ignored
+_CACHE_VERSION = 3
+_JD_PRECISION = 6
+
+# Number of day tables kept in memory per cache
+_MEMORY_DAYS = 32
+
+# Longest time (seconds) changed days are kept in memory only, between evictions
+FLUSH_INTERVAL = 60.0
+
+# Most positions stored per day (a minute resolution for 10 planets is 14400)
+MAX_DAY_ROWS = 20_000
+
+# Julian Date of 0001-01-01 00:00 minus one day, so that
+# date.fromordinal(int(jd - _JD_ORDINAL_OFFSET)) is the calendar day of jd
+_JD_ORDINAL_OFFSET = 1721424.5
+
+PositionRow = tuple[float, float, float, bool]
+
+
+class PositionsCache:
+    """Thread-safe store of planet positions: memory day tables over per-day JSON files."""
+
+    def __init__(
+        self,
+        directory: str,
+        memory_days: int = _MEMORY_DAYS,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_day_rows: int = MAX_DAY_ROWS,
+    ):
+        """
+        Open (or create) the cache directory.
+
+        Args:
+            directory: Directory holding the day files
+            memory_days: Number of day tables kept in memory
+            flush_interval: Longest time (seconds) changed days stay unwritten
+            max_day_rows: Most positions stored per day
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.memory_days = memory_days
+        self.flush_interval = flush_interval
+        self.max_day_rows = max_day_rows
+        self._lock = threading.Lock()
+        # Serializes file writes, which happen outside _lock
+        self._write_lock = threading.Lock()
+        self._days: OrderedDict[int, dict[str, PositionRow]] = OrderedDict()
+        self._dirty: set[int] = set()
+        # Changed days evicted from memory whose file is not written yet
+        self._evicted: dict[int, dict[str, PositionRow]] = {}
+        # Snapshot sequence numbers, so an older snapshot never overwrites a newer file
+        self._snapshot_seq = 0
+        self._written_seq: dict[int, int] = {}
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def key(planet_id: str, jd: float) -> str:
+        """Build the cache key for a planet at a TT Julian Date."""
+        return f"{planet_id}:{jd:.{_JD_PRECISION}f}"
+
+    def _path(self, ordinal: int) -> str:
+        return os.path.join(self.directory, f"{date.fromordinal(ordinal).isoformat()}.json")
+
+    def _read_day(self, ordinal: int) -> dict[str, PositionRow]:
+        # A missing, truncated or malformed file is just a cache miss
+        try:
+            with open(self._path(ordinal), encoding="utf-8") as f:
+                payload = json.load(f)
+            if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+                return {}
+            return {
+                key: (float(lon), float(lat), float(speed_lon), bool(retrograde))
+                for key, (lon, lat, speed_lon, retrograde) in payload["rows"].items()
+            }
+        except Exception:
+            return {}
+
+    def _write_day(self, ordinal: int, rows: dict[str, PositionRow]) -> None:
+        # Write to a temporary file and rename, so readers never see a partial file
+        payload = {"version": _CACHE_VERSION, "rows": rows}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, self._path(ordinal))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _take_pending(self, all_dirty: bool) -> list[tuple[int, int, dict[str, PositionRow]]]:
+        """Collect the day tables to write (called with _lock held)."""
+        pending = list(self._evicted.items())
+        self._evicted.clear()
+        if all_dirty:
+            # Copy the tables, so they can be serialized while lookups go on
+            pending.extend((ordinal, dict(self._days[ordinal])) for ordinal in self._dirty)
+            self._dirty.clear()
+            self._last_flush = time.monotonic()
+        if not pending:
+            return []
+        self._snapshot_seq += 1
+        return [(ordinal, self._snapshot_seq, rows) for ordinal, rows in pending]
+
+    def _write_pending(self, pending: list[tuple[int, int, dict[str, PositionRow]]]) -> None:
+        """Write collected day tables (called without _lock held)."""
+        if not pending:
+            return
+        with self._write_lock:
+            for ordinal, seq, rows in pending:
+                if self._written_seq.get(ordinal, 0) > seq:
+                    continue
+                try:
+                    self._write_day(ordinal, rows)
+                    self._written_seq[ordinal] = seq
+                except OSError:
+                    # A failed write is not fatal: the rows are kept in memory,
+                    # and the day stays dirty for the next flush
+                    with self._lock:
+                        table = self._days.get(ordinal)
+                        if table is None:
+                            self._evicted.setdefault(ordinal, rows)
+                        else:
+                            for key, row in rows.items():
+                                table.setdefault(key, row)
+                            self._dirty.add(ordinal)
+
+    def _day(self, ordinal: int) -> dict[str, PositionRow]:
+        """Return the in-memory table for a day, loading it from disk on first access."""
+        rows = self._days.get(ordinal)
+        if rows is not None:
+            self._days.move_to_end(ordinal)
+            return rows
+
+        rows = self._evicted.pop(ordinal, None)
+        if rows is not None:
+            self._dirty.add(ordinal)
+        else:
+            rows = self._read_day(ordinal)
+        self._days[ordinal] = rows
+        while len(self._days) > self.memory_days:
+            evicted, evicted_rows = self._days.popitem(last=False)
+            if evicted in self._dirty:
+                self._dirty.discard(evicted)
+                self._evicted[evicted] = evicted_rows
+        return rows
+
+    def get_many(self, planet_id: str, jds: Sequence[float]) -> list[Optional[PositionRow]]:
+        """Look up a planet at several TT Julian Dates, returning None for misses."""
+        with self._lock:
+            rows = [
+                self._day(int(jd - _JD_ORDINAL_OFFSET)).get(self.key(planet_id, jd))
+                for jd in jds
+            ]
+            pending = self._take_pending(all_dirty=False)
+        self._write_pending(pending)
+        return rows
+
+    def put_many(self, planet_id: str, items: Iterable[tuple[float, PositionRow]]) -> None:
+        """Store positions of a planet in memory; day files are written later."""
+        with self._lock:
+            for jd, row in items:
+                ordinal = int(jd - _JD_ORDINAL_OFFSET)
+                table = self._day(ordinal)
+                if len(table) >= self.max_day_rows:
+                    continue
+                table[self.key(planet_id, jd)] = row
+                self._dirty.add(ordinal)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+            pending = self._take_pending(all_dirty=due)
+        self._write_pending(pending)
+
+    def load_day(self, day: date) -> int:
+        """Load a day file into memory, returning the number of cached positions."""
+        with self._lock:
+            count = len(self._day(day.toordinal()))
+            pending = self._take_pending(all_dirty=False)
+        self._write_pending(pending)
+        return count
+
+    def flush(self) -> None:
+        """Write every changed day file."""
+        with self._lock:
+            pending = self._take_pending(all_dirty=True)
+        self._write_pending(pending)
+
+    def close(self) -> None:
+        """Write any pending changes."""
+        self.flush()
+
+
+def default_cache_dir() -> Optional[str]:
+    """Return the default cache directory, or None if CRIUS_JPL_CACHE_DISABLE is set."""
+    if os.getenv(CACHE_DISABLE_ENV, "").lower() in ("1", "true", "yes"):
+        return None
+    cache_dir = os.getenv(CACHE_DIR_ENV)
+    if cache_dir:
+        return cache_dir
+    if user_cache_dir is not None:
+        return os.path.join(user_cache_dir("crius_jpl"), "eph")
+    return os.path.join(os.path.expanduser("~"), ".cache", "crius_jpl", "eph")
+
+
+def resolve_cache_dir(cache_dir: Optional[str] = None) -> Optional[str]:
+    """Return the cache directory from the argument or the default location, if any."""
+    cache_dir = cache_dir or default_cache_dir()
+    return os.path.abspath(cache_dir) if cache_dir else None
+
+
+@functools.cache
+def get_positions_cache(directory: str) -> PositionsCache:
+    """
+    Get the process-wide cache for a directory.
+
+    Every adapter pointing at the same directory shares one instance, and so
+    one memory tier.
+    """
+    cache = PositionsCache(directory)
+    atexit.register(cache.close)
+    return cache
+
+
+def load_ephemeris_to_cache(day: date, cache_dir: Optional[str] = None) -> int:
+    """
+    Load the cached positions of a day from disk into the memory tier.
+
+    Args:
+        day: Calendar day (TT) to load
+        cache_dir: Cache directory (default: CRIUS_JPL_CACHE_DIR or the user cache)
+
+    Returns:
+        Number of positions available for that day, or 0 if the cache is disabled
+    """
+    directory = resolve_cache_dir(cache_dir)
+    if directory is None:
+        return 0
+    return get_positions_cache(directory).load_day(day)
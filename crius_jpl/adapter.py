@@ -4,15 +4,30 @@ JPL Ephemeris adapter implementation.
 This module provides a JPL Ephemeris adapter that conforms to the
 crius-ephemeris-core EphemerisAdapter protocol, using NASA JPL DE430t
 ephemeris data via the skyfield library.
+
+The skyfield timescale is built from the leap-second and Delta T tables
+bundled with skyfield. That is already skyfield's default in every supported
+release; it is requested explicitly (``load.timescale(builtin=True)``) so that
+adapter construction stays offline regardless. Set
+``CRIUS_JPL_ALLOW_NETWORK=1`` to download the latest IERS files instead.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional, Sequence, Union
+from collections import OrderedDict
+import copy
+import functools
 import os
+import threading
+from types import MappingProxyType
+import numpy as np
 import swisseph as swe
 import pytz
 from skyfield.api import load
 from skyfield.framelib import ecliptic_frame
+from skyfield.functions import mxv
+from skyfield.jpllib import SpiceKernel
+from skyfield.timelib import Timescale
 
 from crius_ephemeris_core import (
     EphemerisSettings,
@@ -23,15 +38,25 @@ from crius_ephemeris_core import (
     EphemerisAdapter,
 )
 
+try:
+    # Ayanamsa constants are shared with crius-swiss (optional, sidereal Chiron only)
+    from crius_swiss.adapter import AYANAMSA_MAP, DEFAULT_AYANAMSA
+except ImportError:
+    AYANAMSA_MAP = None
+    DEFAULT_AYANAMSA = None
+
 from .exceptions import (
     EphemerisDownloadError,
     EphemerisLoadError,
     DateRangeError,
 )
-from .validation import check_date_range
+from .validation import _check_jd_range, _to_timestamp
+from ._data import DE430T_FILENAME, fetch_kernel
+from ._ephemeris_cache import PositionRow, get_positions_cache, resolve_cache_dir
+from .settings import JplLocation, JplSettings, as_location, as_settings
 
-# Skyfield planet body mapping
-SKYFIELD_BODIES = {
+# Skyfield planet body mapping (read-only; body caches are built from it)
+SKYFIELD_BODIES = MappingProxyType({
     "sun": "sun",
     "moon": "moon",
     "mercury": "mercury",
@@ -42,44 +67,174 @@ SKYFIELD_BODIES = {
     "uranus": "uranus barycenter",
     "neptune": "neptune barycenter",
     "pluto": "pluto barycenter",
-}
+})
+
+# Set to download fresh IERS leap-second/Delta T files instead of using skyfield's bundled ones
+ALLOW_NETWORK_ENV = "CRIUS_JPL_ALLOW_NETWORK"
 
-# Shared skyfield loader instances (class-level cache)
-_shared_timescale = None
-_shared_ephemeris = None
-_loader_lock = None
+# Sentinel for cache lookups where None is not a usable "missing" marker
+_MISSING = object()
 
 
-def _get_shared_loader():
-    """Get or create shared skyfield loader instances."""
-    global _shared_timescale, _shared_ephemeris, _loader_lock
+def _load_jpl_kernel() -> SpiceKernel:
+    """
+    Load the DE430t kernel.
     
-    if _loader_lock is None:
-        import threading
-        _loader_lock = threading.Lock()
+    Uses a copy skyfield has already downloaded, else the pooch registry
+    cache (atomic downloads) when pooch is installed, and falls back to
+    skyfield's built-in downloader.
+    """
+    path = fetch_kernel(DE430T_FILENAME)
+    if path is not None:
+        return SpiceKernel(path)
+    return load(DE430T_FILENAME)
+
+
+def _restrict_kernel(kernel: SpiceKernel, bodies: frozenset[str]) -> SpiceKernel:
+    """
+    Drop every SPK segment that is not needed to reach Earth or the given bodies.
     
-    with _loader_lock:
-        if _shared_timescale is None:
-            try:
-                _shared_timescale = load.timescale()
-            except Exception as e:
-                raise EphemerisLoadError(f"Failed to load skyfield timescale: {str(e)}") from e
+    Skyfield resolves bodies from the kernel's live segment list, so the
+    remaining segments are the only ones whose coefficients are ever read.
+    
+    Args:
+        kernel: Kernel to restrict in place
+        bodies: Planet IDs (keys of SKYFIELD_BODIES) to keep; others are ignored
         
-        if _shared_ephemeris is None:
-            try:
-                _shared_ephemeris = load('de430t.bsp')
-            except Exception as e:
-                error_str = str(e).lower()
-                if 'download' in error_str or 'network' in error_str or 'connection' in error_str:
-                    raise EphemerisDownloadError(
-                        f"Failed to download JPL ephemeris data: {str(e)}"
-                    ) from e
-                else:
-                    raise EphemerisLoadError(
-                        f"Failed to load JPL ephemeris data: {str(e)}"
-                    ) from e
+    Returns:
+        The same kernel, for chaining
+    """
+    targets = ['earth'] + [
+        body_name for body_name in map(SKYFIELD_BODIES.get, sorted(bodies)) if body_name is not None
+    ]
+    keep = set()
+    for name in targets:
+        code = kernel.decode(name)
+        while code != 0:
+            matches = [s for s in kernel.segments if s.target == code]
+            if not matches:
+                break
+            keep.update(matches)
+            code = matches[0].center
+    
+    kernel.segments[:] = [s for s in kernel.segments if s in keep]
+    return kernel
+
+
+def _load_timescale() -> Timescale:
+    """Load the skyfield timescale from the bundled tables, unless network use is allowed."""
+    allow_network = os.getenv(ALLOW_NETWORK_ENV, "").lower() in ("1", "true", "yes")
+    try:
+        return load.timescale(builtin=not allow_network)
+    except Exception as e:
+        raise EphemerisLoadError(f"Failed to load skyfield timescale: {str(e)}") from e
+
+
+# Shared skyfield loader instances are memoized with functools.cache rather than
+# guarded by a lock: cache hits are lock-free (including on free-threaded CPython),
+# and loading is idempotent, so if two threads race on the first call both loads
+# succeed and one result is kept. Failures are not cached and are retried.
+
+@functools.cache
+def _get_shared_timescale() -> Timescale:
+    """Get or create the shared skyfield timescale."""
+    return _load_timescale()
+
+
+@functools.cache
+def _get_shared_ephemeris(bodies: Optional[frozenset[str]] = None) -> SpiceKernel:
+    """
+    Get or create a shared JPL kernel.
+    
+    Args:
+        bodies: Optional set of planet IDs; if given, the kernel is opened on its
+                own and keeps only the segments those bodies need, so the full
+                kernel is never loaded for restricted adapters
+    """
+    try:
+        kernel = _load_jpl_kernel()
+    except Exception as e:
+        error_str = str(e).lower()
+        if 'download' in error_str or 'network' in error_str or 'connection' in error_str:
+            raise EphemerisDownloadError(
+                f"Failed to download JPL ephemeris data: {str(e)}"
+            ) from e
+        else:
+            raise EphemerisLoadError(
+                f"Failed to load JPL ephemeris data: {str(e)}"
+            ) from e
     
-    return _shared_timescale, _shared_ephemeris
+    if bodies is not None:
+        _restrict_kernel(kernel, bodies)
+    return kernel
+
+
+@functools.cache
+def _get_shared_loader(bodies: Optional[frozenset[str]] = None) -> tuple[Timescale, SpiceKernel]:
+    """
+    Get or create shared skyfield loader instances.
+    
+    Args:
+        bodies: Optional set of planet IDs; if given, the returned ephemeris is a
+                shared kernel holding only the segments those bodies need
+    """
+    return _get_shared_timescale(), _get_shared_ephemeris(bodies)
+
+
+# Swiss Ephemeris keeps its data path in process-global C state; track what was
+# last pushed so repeated calls with the same path are skipped. Only this
+# module's own calls are tracked, so other code sharing the C library in the
+# same process (e.g. crius-swiss) must use the same path. The sidereal mode is
+# cheap to set and is pushed on every sidereal Chiron calculation instead, with
+# the lock held until calc_ut returns so threads can't swap it in between
+_swe_state_lock = threading.Lock()
+_current_ephe_path: Optional[str] = None
+
+
+def _set_ephe_path(ephemeris_path: str) -> None:
+    """Set the Swiss Ephemeris data path unless it is already active."""
+    global _current_ephe_path
+    
+    with _swe_state_lock:
+        if ephemeris_path != _current_ephe_path:
+            swe.set_ephe_path(ephemeris_path)
+            _current_ephe_path = ephemeris_path
+
+
+@functools.lru_cache(maxsize=64)
+def _chiron_flags(
+    zodiac_type: Optional[str], ayanamsa: Optional[str]
+) -> Optional[tuple[int, Optional[int]]]:
+    """
+    Resolve Swiss Ephemeris flags and sidereal mode for a Chiron calculation.
+    
+    Returns:
+        Tuple of (flags, sidereal mode or None if unchanged), or None if the
+        ayanamsa cannot be mapped because crius-swiss is not installed
+    """
+    flags = swe.FLG_SWIEPH
+    if zodiac_type != "sidereal":
+        return flags, None
+    
+    flags |= swe.FLG_SIDEREAL
+    if not ayanamsa:
+        return flags, None
+    
+    # Map ayanamsa to Swiss Ephemeris constant
+    if AYANAMSA_MAP is None:
+        return None
+    return flags, AYANAMSA_MAP.get(ayanamsa.lower(), DEFAULT_AYANAMSA)
+
+
+# Result keys for house cusps and angles, in Swiss Ephemeris order
+_CUSP_LABELS = tuple(str(i) for i in range(1, 13))
+_ANGLE_LABELS = ("asc", "mc", "ic", "dc")
+
+# Number of per-Time Earth positions and ecliptic rotation matrices kept per adapter
+_TIME_FRAME_CACHE_SIZE = 32
+
+# Julian Day rounding for the houses cache key (1e-8 day is about 1 ms)
+_HOUSES_JD_PRECISION = 8
 
 # House system mapping (using Swiss Ephemeris for houses)
 HOUSE_SYSTEM_MAP = {
@@ -93,21 +248,123 @@ HOUSE_SYSTEM_MAP = {
     "morinus": b'M',
 }
 
+# Gregorian calendar reform year; earlier dates are delegated to swe.julday
+_GREGORIAN_REFORM_YEAR = 1582
+
 
 def _datetime_to_jd(dt_utc: datetime) -> float:
     """Convert UTC datetime to Julian Day."""
-    return swe.julday(
+    year = dt_utc.year
+    if year > _GREGORIAN_REFORM_YEAR:
+        # Fliegel-Van Flandern day number, valid for the Gregorian calendar
+        a = (14 - dt_utc.month) // 12
+        y = year + 4800 - a
+        m = dt_utc.month + 12 * a - 3
+        jdn = (
+            dt_utc.day + (153 * m + 2) // 5 + 365 * y
+            + y // 4 - y // 100 + y // 400 - 32045
+        )
+        return jdn + (dt_utc.hour - 12) / 24.0 + dt_utc.minute / 1440.0 + dt_utc.second / 86400.0
+    
+    return float(swe.julday(
         dt_utc.year,
         dt_utc.month,
         dt_utc.day,
         dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0,
         swe.GREG_CAL
-    )
+    ))
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_houses_cached(
+    jd_rounded: float,
+    lat: float,
+    lon: float,
+    house_system_bytes: bytes,
+) -> Optional[tuple[tuple[float, ...], tuple[float, ...]]]:
+    """
+    Compute house cusps and angles with Swiss Ephemeris, memoized per chart key.
+    
+    Returns:
+        Tuple of (cusps for houses 1-12, (asc, mc, ic, dc)), or None if the
+        calculation returned no data
+    """
+    result = swe.houses_ex2(jd_rounded, lat, lon, house_system_bytes, swe.FLG_SWIEPH)
+
+    if not result or len(result) == 0:
+        return None
+
+    cusps = result[0]
+    ascmc = result[1]
+
+    # Extract house cusps: Whole Sign returns indices 0-11 for houses 1-12,
+    # Placidus and others return indices 1-12
+    house_cusps = np.asarray(cusps[:12] if len(cusps) == 12 else cusps[1:13]) % 360.0
+
+    # Extract angles
+    asc_mc = np.zeros(2)
+    asc_mc[:len(ascmc[:2])] = ascmc[:2]
+    asc_mc %= 360.0
+    angles = np.concatenate((asc_mc, (asc_mc[::-1] + 180.0) % 360.0))  # asc, mc, ic, dc
+
+    return tuple(house_cusps.tolist()), tuple(angles.tolist())
+
+
+def _as_utc(dts: Iterable[datetime]) -> list[datetime]:
+    """Convert aware datetimes to UTC; naive datetimes are taken to be UTC already."""
+    utc = timezone.utc
+    return [dt if dt.tzinfo is None or dt.tzinfo is utc else dt.astimezone(utc) for dt in dts]
+
+
+# Memoized calc_positions_cached results: instants are truncated to this many
+# seconds, so calls within the same window share one entry
+_POSITIONS_LRU_SIZE = 1024
+_POSITIONS_ROUNDING_SECONDS = 1
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class _PositionsCallKey:
+    """
+    Hashable wrapper for one calc_positions call.
+    
+    Hashing and equality use the adapter, the rounded instant and the
+    (hashable) location and settings.
+    """
+
+    __slots__ = ("adapter", "dt_utc", "location", "settings", "key", "_hash")
+
+    def __init__(
+        self,
+        adapter: "JplEphemerisAdapter",
+        dt_utc: datetime,
+        location: Optional[Union[GeoLocation, JplLocation]],
+        settings: Union[EphemerisSettings, JplSettings],
+    ):
+        instant = int(_to_timestamp(dt_utc) // _POSITIONS_ROUNDING_SECONDS)
+        self.adapter = adapter
+        # Compute at the start of the rounding window so every call sharing
+        # this key gets the same result
+        self.dt_utc = _UNIX_EPOCH + timedelta(seconds=instant * _POSITIONS_ROUNDING_SECONDS)
+        self.location = as_location(location)
+        self.settings = as_settings(settings)
+        self.key = (id(adapter), instant, self.location, self.settings)
+        self._hash = hash(self.key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _PositionsCallKey)
+            and self.adapter is other.adapter
+            and self.key == other.key
+        )
 
 
-def _get_house_system_bytes(house_system: str) -> bytes:
-    """Convert house system string to bytes format."""
-    return HOUSE_SYSTEM_MAP.get(house_system.lower(), b'P')  # Default to Placidus
+@functools.lru_cache(maxsize=_POSITIONS_LRU_SIZE)
+def _calc_positions_lru(call: _PositionsCallKey) -> LayerPositions:
+    """Compute positions for a call key (memoized; results must not be mutated)."""
+    return call.adapter.calc_positions(call.dt_utc, call.location, call.settings)
 
 
 class JplEphemerisAdapter:
@@ -120,7 +377,14 @@ class JplEphemerisAdapter:
     Thin wrapper that conforms to the EphemerisAdapter protocol from crius-ephemeris-core.
     """
     
-    def __init__(self, ephemeris_path: Optional[str] = None, retry_downloads: bool = True, use_shared_loader: bool = True):
+    def __init__(
+        self,
+        ephemeris_path: Optional[str] = None,
+        retry_downloads: bool = True,
+        use_shared_loader: bool = True,
+        bodies: Optional[list[str]] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """
         Initialize adapter with JPL ephemeris data.
         
@@ -128,29 +392,38 @@ class JplEphemerisAdapter:
             ephemeris_path: Optional path for Swiss Ephemeris data files (for houses).
                           If None, uses default /usr/local/share/swisseph
                           or SWISS_EPHEMERIS_PATH environment variable.
+                          Other Swiss Ephemeris users in the same process
+                          (e.g. crius-swiss) must use the same path.
             retry_downloads: Whether to retry failed downloads (default: True)
             use_shared_loader: Whether to use shared loader instances (default: True, more efficient)
+            bodies: Optional list of planet IDs to support. If given, only the JPL
+                    kernel segments needed for these bodies are kept, and other
+                    skyfield planets are omitted from results. Lunar nodes and
+                    Chiron come from Swiss Ephemeris and are unaffected.
+            cache_dir: Optional directory for the planet positions cache.
+                       If None, uses CRIUS_JPL_CACHE_DIR environment variable,
+                       else the per-user cache directory; setting
+                       CRIUS_JPL_CACHE_DISABLE=1 turns the default off.
         
         Raises:
             EphemerisDownloadError: If ephemeris download fails
             EphemerisLoadError: If ephemeris data fails to load
         """
+        body_subset = frozenset(b.lower() for b in bodies) if bodies is not None else None
+        
         # Use shared loader instances for efficiency (shared across all adapter instances)
         if use_shared_loader:
-            self.ts, self.eph = _get_shared_loader()
+            self.ts, self.eph = _get_shared_loader(body_subset)
         else:
             # Load JPL ephemeris (skyfield automatically downloads DE430t on first use)
-            try:
-                self.ts = load.timescale()
-            except Exception as e:
-                raise EphemerisLoadError(f"Failed to load skyfield timescale: {str(e)}") from e
+            self.ts = _load_timescale()
             
             # Try to load ephemeris with retry logic
             max_retries = 3 if retry_downloads else 1
             
             for attempt in range(max_retries):
                 try:
-                    self.eph = load('de430t.bsp')
+                    self.eph = _load_jpl_kernel()
                     break
                 except Exception as e:
                     if attempt < max_retries - 1:
@@ -168,25 +441,63 @@ class JplEphemerisAdapter:
                             raise EphemerisLoadError(
                                 f"Failed to load JPL ephemeris data: {str(e)}"
                             ) from e
+            
+            if body_subset is not None:
+                _restrict_kernel(self.eph, body_subset)
         
         # Initialize Swiss Ephemeris for house calculations
         if ephemeris_path is None:
             ephemeris_path = os.getenv("SWISS_EPHEMERIS_PATH", "/usr/local/share/swisseph")
-        swe.set_ephe_path(ephemeris_path)
+        _set_ephe_path(ephemeris_path)
         self.ephemeris_path = ephemeris_path
         
-        # Cache for skyfield bodies (instance-level for thread safety)
-        self._body_cache: dict[str, any] = {}
+        # Earth is the observer for every geocentric position
+        self._earth = self.eph['earth']
+        
+        # Cache for skyfield bodies (instance-level for thread safety),
+        # pre-populated so the calculation path never walks the segment table
+        self._body_cache: dict[str, Any] = {}
+        for planet_id, body_name in SKYFIELD_BODIES.items():
+            if body_name in self.eph:
+                self._body_cache[planet_id] = self.eph[body_name]
+        
+        # Resolved house system bytes, keyed on the settings string as given
+        self._house_bytes_cache: dict[str, bytes] = {}
+        
+        # Earth's position and the ecliptic rotation matrix per set of instants
+        # (keyed on TT), shared by all bodies observed at those times (LRU)
+        self._time_frame_cache: OrderedDict[Any, tuple[Any, Any]] = OrderedDict()
+        self._time_frame_lock = threading.Lock()
+        
+        # Two-tier cache of planet positions (shared per directory). An unusable
+        # default location just disables it; an explicit cache_dir must work
+        self._positions_cache = None
+        resolved_cache_dir = resolve_cache_dir(cache_dir)
+        if resolved_cache_dir:
+            try:
+                self._positions_cache = get_positions_cache(resolved_cache_dir)
+            except OSError:
+                if cache_dir:
+                    raise
+        
+        # Objects not computed from the JPL kernel; everything else goes
+        # through _handle_regular
+        self._object_handlers = {
+            "north_node": self._handle_north_node,
+            "south_node": self._handle_south_node,
+            "chiron": self._handle_chiron,
+        }
 
-    def _get_body(self, planet_id: str):
+    def _get_body(self, planet_id: str) -> Any:
         """Get Skyfield body object for a planet ID."""
-        if planet_id in self._body_cache:
-            return self._body_cache[planet_id]
+        body = self._body_cache.get(planet_id, _MISSING)
+        if body is not _MISSING:
+            return body
         
-        if planet_id not in SKYFIELD_BODIES:
+        body_name = SKYFIELD_BODIES.get(planet_id)
+        if body_name is None:
             return None
         
-        body_name = SKYFIELD_BODIES[planet_id]
         body = self.eph[body_name]
         self._body_cache[planet_id] = body
         return body
@@ -194,8 +505,8 @@ class JplEphemerisAdapter:
     def calc_positions(
         self,
         dt_utc: datetime,
-        location: Optional[GeoLocation],
-        settings: EphemerisSettings,
+        location: Optional[Union[GeoLocation, JplLocation]],
+        settings: Union[EphemerisSettings, JplSettings],
     ) -> LayerPositions:
         """
         Calculate planetary and house positions using JPL ephemeris.
@@ -205,151 +516,411 @@ class JplEphemerisAdapter:
         
         Args:
             dt_utc: UTC datetime for calculation
-            location: Optional geographic location (required for houses)
-            settings: Ephemeris calculation settings
+            location: Optional geographic location (required for houses), as a
+                GeoLocation dict or JplLocation
+            settings: Ephemeris calculation settings, as an EphemerisSettings
+                dict or JplSettings
             
         Returns:
             LayerPositions with planetary positions and optionally house positions
         
         Raises:
-            DateRangeError: If date is outside JPL DE430t supported range (1550-2650 CE)
+            DateRangeError: If date is outside the JPL DE430t kernel coverage (1550-2650 CE)
         """
-        # Validate date range
-        check_date_range(dt_utc, raise_error=True)
-        
-        # Convert datetime to Skyfield Time
-        t = self.ts.utc(
-            dt_utc.year,
-            dt_utc.month,
-            dt_utc.day,
-            dt_utc.hour,
-            dt_utc.minute,
-            dt_utc.second + dt_utc.microsecond / 1_000_000.0
-        )
-        
-        # Calculate planets
-        planets: dict[str, PlanetPosition] = {}
-        include_objects = settings.get("include_objects", [])
+        return self.calc_positions_batch([dt_utc], location, settings)[0]
 
-        for obj_id in include_objects:
-            obj_id_lower = obj_id.lower()
+    def calc_positions_cached(
+        self,
+        dt_utc: datetime,
+        location: Optional[Union[GeoLocation, JplLocation]],
+        settings: Union[EphemerisSettings, JplSettings],
+    ) -> LayerPositions:
+        """
+        Calculate positions like calc_positions, memoized in a process-wide LRU cache.
+        
+        Calls are keyed on this adapter, the instant truncated to whole seconds,
+        and the location and settings values. The result is calculated for
+        the truncated instant, and each call returns its own copy.
+        
+        Args:
+            dt_utc: UTC datetime for calculation
+            location: Optional geographic location (required for houses), as a
+                GeoLocation dict or JplLocation
+            settings: Ephemeris calculation settings, as an EphemerisSettings
+                dict or JplSettings
             
-            # Handle special cases
-            if obj_id_lower == "south_node":
-                # South Node is 180 degrees from North Node
-                north_node_pos = self._calc_planet_position("north_node", t, dt_utc)
-                if north_node_pos:
-                    south_lon = (north_node_pos["lon"] + 180) % 360
-                    planets["south_node"] = {
-                        "lon": south_lon,
-                        "lat": 0.0,
-                        "speed_lon": north_node_pos["speed_lon"],
-                        "retrograde": north_node_pos["retrograde"],
-                    }
-                continue
-
-            if obj_id_lower == "north_node":
-                # Calculate lunar nodes from moon's orbit
-                node_pos = self._calc_lunar_node(t, dt_utc)
-                if node_pos:
-                    planets["north_node"] = node_pos
-                continue
+        Returns:
+            LayerPositions with planetary positions and optionally house positions
+        
+        Raises:
+            DateRangeError: If date is outside the JPL DE430t kernel coverage (1550-2650 CE)
+        """
+        key = _PositionsCallKey(self, dt_utc, location, settings)
+        return copy.deepcopy(_calc_positions_lru(key))
 
-            if obj_id_lower == "chiron":
-                # Chiron not available in JPL, use Swiss Ephemeris (hybrid approach)
-                chiron_pos = self._calc_chiron_swiss(dt_utc, settings)
-                if chiron_pos:
-                    planets["chiron"] = chiron_pos
+    def calc_positions_batch(
+        self,
+        dts: Sequence[datetime],
+        location: Optional[Union[GeoLocation, JplLocation]],
+        settings: Union[EphemerisSettings, JplSettings],
+    ) -> list[LayerPositions]:
+        """
+        Calculate planetary and house positions for several datetimes at once.
+        
+        All datetimes are packed into a single skyfield Time array so that each
+        body needs only one vectorized observe() call regardless of the number
+        of datetimes.
+        
+        Args:
+            dts: UTC datetimes for calculation
+            location: Optional geographic location (required for houses), as a
+                GeoLocation dict or JplLocation
+            settings: Ephemeris calculation settings, as an EphemerisSettings
+                dict or JplSettings
+            
+        Returns:
+            List of LayerPositions, one per datetime, in input order
+        
+        Raises:
+            DateRangeError: If any date is outside the JPL DE430t kernel coverage (1550-2650 CE)
+        """
+        # Times are built from the wall-clock fields, so convert to UTC first
+        dts = _as_utc(dts)
+        
+        if not dts:
+            return []
+        
+        # Convert datetimes to a single vector Skyfield Time, and validate the
+        # range on its TT Julian Dates
+        t_all = self._time_array(dts)
+        _check_jd_range(t_all.tt, dts)
+        
+        # Convert dict inputs once; everything below uses attribute access
+        settings = as_settings(settings)
+        location = as_location(location)
+        
+        # Adapters can be long-lived and share the global Swiss Ephemeris state,
+        # so make sure this adapter's data path is active (no-op if unchanged)
+        _set_ephe_path(self.ephemeris_path)
+        
+        # Calculate planets. One entry per requested object is preallocated for
+        # every datetime and filled in place; entries that cannot be computed are
+        # dropped afterwards. JplSettings has already lowercased and deduplicated
+        # include_objects and precomputed its membership set
+        requested = settings.include_objects
+        requested_set = settings.include_set
+        planets_list: list[dict[str, PlanetPosition]] = [
+            {
+                obj_id: {"lon": 0.0, "lat": 0.0, "speed_lon": 0.0, "retrograde": False}
+                for obj_id in requested
+            }
+            for _ in dts
+        ]
+
+        # Both nodes derive from the same North Node calculation, so do it once
+        node_positions: list[Optional[PlanetPosition]] = []
+        if "north_node" in requested_set or "south_node" in requested_set:
+            node_positions = [self._calc_lunar_node(dt_utc) for dt_utc in dts]
+
+        handlers = self._object_handlers
+        handle_regular = self._handle_regular
+        for obj_id_lower in requested:
+            handler = handlers.get(obj_id_lower, handle_regular)
+            handler(obj_id_lower, planets_list, dts, t_all, settings, node_positions)
+
+        # Resolve the house system once per call
+        if location is not None:
+            house_system = settings.house_system
+            house_system_bytes = self._house_system_bytes(house_system)
+
+        results: list[LayerPositions] = []
+        for planets, dt_utc in zip(planets_list, dts):
+            # Calculate houses if location is provided (using Swiss Ephemeris)
+            houses: Optional[HousePositions] = None
+            if location is not None:
+                jd = _datetime_to_jd(dt_utc)
+                houses = self._calc_houses(
+                    jd, location.lat, location.lon, house_system_bytes, house_system
+                )
+
+            results.append({
+                "planets": planets,
+                "houses": houses,
+            })
+
+        return results
+
+    def _house_system_bytes(self, house_system: str) -> bytes:
+        """Resolve a house system name to Swiss Ephemeris bytes (Placidus if unknown)."""
+        # HOUSE_SYSTEM_MAP is fixed, so the resolved bytes are cached per instance
+        house_system_bytes = self._house_bytes_cache.get(house_system)
+        if house_system_bytes is None:
+            house_system_bytes = HOUSE_SYSTEM_MAP.get(house_system.lower(), b'P')
+            self._house_bytes_cache[house_system] = house_system_bytes
+        return house_system_bytes
+
+    def _handle_north_node(
+        self,
+        obj_id: str,
+        planets_list: list[dict[str, PlanetPosition]],
+        dts: Sequence[datetime],
+        t_all: Any,
+        settings: JplSettings,
+        node_positions: list[Optional[PlanetPosition]],
+    ) -> None:
+        """Fill the North Node entries from the precomputed node positions."""
+        for planets, node_pos in zip(planets_list, node_positions):
+            if node_pos:
+                planets[obj_id].update(node_pos)
+            else:
+                del planets[obj_id]
+
+    def _handle_south_node(
+        self,
+        obj_id: str,
+        planets_list: list[dict[str, PlanetPosition]],
+        dts: Sequence[datetime],
+        t_all: Any,
+        settings: JplSettings,
+        node_positions: list[Optional[PlanetPosition]],
+    ) -> None:
+        """Fill the South Node entries, 180 degrees from the North Node."""
+        for planets, node_pos in zip(planets_list, node_positions):
+            if node_pos:
+                pos = planets[obj_id]
+                pos["lon"] = (node_pos["lon"] + 180) % 360
+                pos["speed_lon"] = node_pos["speed_lon"]
+                pos["retrograde"] = node_pos["retrograde"]
+            else:
+                del planets[obj_id]
+
+    def _handle_chiron(
+        self,
+        obj_id: str,
+        planets_list: list[dict[str, PlanetPosition]],
+        dts: Sequence[datetime],
+        t_all: Any,
+        settings: JplSettings,
+        node_positions: list[Optional[PlanetPosition]],
+    ) -> None:
+        """Fill the Chiron entries (not in JPL, so Swiss Ephemeris is used)."""
+        for planets, dt_utc in zip(planets_list, dts):
+            chiron_pos = self._calc_chiron_swiss(dt_utc, settings)
+            if chiron_pos:
+                planets[obj_id].update(chiron_pos)
+            else:
+                del planets[obj_id]
+
+    def _handle_regular(
+        self,
+        obj_id: str,
+        planets_list: list[dict[str, PlanetPosition]],
+        dts: Sequence[datetime],
+        t_all: Any,
+        settings: JplSettings,
+        node_positions: list[Optional[PlanetPosition]],
+    ) -> None:
+        """Fill the entries for a body computed from the JPL kernel."""
+        rows = self._calc_planet_positions(obj_id, t_all)
+        if rows is None:
+            for planets in planets_list:
+                del planets[obj_id]
+            return
+        for planets, row in zip(planets_list, rows):
+            if row is None:
+                del planets[obj_id]
                 continue
+            pos = planets[obj_id]
+            pos["lon"], pos["lat"], pos["speed_lon"], pos["retrograde"] = row
 
-            planet_pos = self._calc_planet_position(obj_id_lower, t, dt_utc)
-            if planet_pos:
-                planets[obj_id_lower] = planet_pos
-
-        # Calculate houses if location is provided (using Swiss Ephemeris)
-        houses: Optional[HousePositions] = None
-        if location:
-            jd = _datetime_to_jd(dt_utc)
-            house_system_bytes = _get_house_system_bytes(settings["house_system"])
-            houses = self._calc_houses(jd, location["lat"], location["lon"], house_system_bytes, settings["house_system"])
-
-        return {
-            "planets": planets,
-            "houses": houses,
-        }
+    def prewarm(self, dts: Iterable[datetime], planets: Optional[Sequence[str]] = None) -> int:
+        """
+        Populate the positions cache for a range of datetimes.
+        
+        All datetimes are evaluated in one vectorized pass per planet; instants
+        that are already cached are skipped. Changed day files are written when
+        their day leaves the memory tier (ranges longer than its 32 days) and
+        for the remaining days at the end.
+        
+        Args:
+            dts: UTC datetimes to precompute (e.g. every hour of a week)
+            planets: Planet IDs to precompute (default: all skyfield planets)
+            
+        Returns:
+            Number of datetimes precomputed, or 0 if the positions cache is disabled
+        
+        Raises:
+            DateRangeError: If any date is outside the JPL DE430t kernel coverage (1550-2650 CE)
+        """
+        if self._positions_cache is None:
+            return 0
+        
+        dts = _as_utc(dts)
+        if not dts:
+            return 0
+        
+        t_all = self._time_array(dts)
+        _check_jd_range(t_all.tt, dts)
+        for planet_id in (planets if planets is not None else SKYFIELD_BODIES):
+            self._calc_planet_positions(planet_id.lower(), t_all)
+        self._positions_cache.flush()
+        return len(dts)
+
+    def _time_array(self, dts: Sequence[datetime]) -> Any:
+        """Convert a sequence of UTC datetimes to a single vector skyfield Time."""
+        # fromiter fills preallocated arrays without intermediate lists
+        n = len(dts)
+        return self.ts.utc(
+            np.fromiter((dt.year for dt in dts), np.int64, n),
+            np.fromiter((dt.month for dt in dts), np.int64, n),
+            np.fromiter((dt.day for dt in dts), np.int64, n),
+            np.fromiter((dt.hour for dt in dts), np.int64, n),
+            np.fromiter((dt.minute for dt in dts), np.int64, n),
+            np.fromiter((dt.second + dt.microsecond / 1_000_000.0 for dt in dts), np.float64, n),
+        )
 
-    def _calc_planet_position(self, planet_id: str, t: any, dt_utc: datetime) -> Optional[PlanetPosition]:
-        """Calculate position for a single planet using JPL ephemeris."""
-        if planet_id not in SKYFIELD_BODIES:
+    def _calc_planet_positions(
+        self, planet_id: str, t_all: Any
+    ) -> Optional[list[Optional[PositionRow]]]:
+        """
+        Calculate positions for a planet, serving cached instants from the positions cache.
+        
+        Only the instants missing from the cache are evaluated, in one vectorized
+        call, and then written back.
+        
+        Returns:
+            One row per instant (None where it could not be computed), or None
+            if the planet is unsupported
+        """
+        # Resolve the body first: the positions cache may be shared with adapters
+        # supporting more bodies, and must not answer for planets this one omits
+        body = self._resolve_body(planet_id)
+        if body is None:
             return None
-
-        try:
-            body = self._get_body(planet_id)
-            if body is None:
-                return None
-
-            # Get position relative to Earth (geocentric)
-            earth = self.eph['earth']
-            astrometric = earth.at(t).observe(body)
-            
-            # Convert to ecliptic coordinates
-            lat, lon, distance = astrometric.frame_latlon(ecliptic_frame)
-            
-            # Convert to degrees
-            longitude = lon.degrees % 360
-            latitude = lat.degrees
-            
-            # Calculate speed by computing position at slightly different time
-            # Use 1 hour difference for speed calculation
-            from datetime import timedelta
-            dt_next = dt_utc + timedelta(hours=1)
-            t_next = self.ts.utc(
-                dt_next.year,
-                dt_next.month,
-                dt_next.day,
-                dt_next.hour,
-                dt_next.minute,
-                dt_next.second + dt_next.microsecond / 1_000_000.0
-            )
-            astrometric_next = earth.at(t_next).observe(body)
-            lat_next, lon_next, _ = astrometric_next.frame_latlon(ecliptic_frame)
-            
-            # Calculate speed in degrees per day
-            lon_diff = (lon_next.degrees - lon.degrees) % 360
-            if lon_diff > 180:
-                lon_diff -= 360
-            speed_longitude = lon_diff * 24.0  # Convert from per-hour to per-day
+        
+        cache = self._positions_cache
+        if cache is None:
+            return self._calc_planet_positions_vec(body, t_all)
+        
+        jds = t_all.tt.tolist()
+        cached = cache.get_many(planet_id, jds)
+        missing = [i for i, value in enumerate(cached) if value is None]
+        
+        if missing:
+            t_missing = t_all if len(missing) == len(jds) else t_all[np.array(missing)]
+            computed = self._calc_planet_positions_vec(body, t_missing)
             
-            is_retrograde = speed_longitude < 0
+            # Instants that could not be computed are left uncached
+            new_items = []
+            for i, row in zip(missing, computed):
+                cached[i] = row
+                if row is not None:
+                    new_items.append((jds[i], row))
+            cache.put_many(planet_id, new_items)
+        
+        return cached
 
-            return {
-                "lon": longitude,
-                "lat": latitude,
-                "speed_lon": speed_longitude,
-                "retrograde": is_retrograde,
-            }
-        except Exception as e:
-            # Log error but don't fail the entire calculation
-            # In a package context, we might want to use a logger if available
-            # For now, we'll just return None
-            pass
-        return None
+    def _time_frame(self, t: Any) -> tuple[Any, Any]:
+        """
+        Return Earth's barycentric position and the ecliptic-of-date rotation
+        matrix for a Time.
+        
+        Results are cached on the TT Julian Date(s), so separate Time objects
+        for the same instants (e.g. repeated calls for one chart) skip the
+        precession-nutation and Earth evaluations.
+        """
+        tt = t.tt
+        key = tt.tobytes() if isinstance(tt, np.ndarray) else tt
+        cache = self._time_frame_cache
+        # Adapters are shared across threads; the LRU bookkeeping is locked, but
+        # the evaluation is not, so threads working on other instants don't wait
+        with self._time_frame_lock:
+            entry = cache.get(key)
+            if entry is not None:
+                cache.move_to_end(key)
+                return entry
+        
+        entry = (self._earth.at(t), ecliptic_frame.rotation_at(t))
+        with self._time_frame_lock:
+            cache[key] = entry
+            if len(cache) > _TIME_FRAME_CACHE_SIZE:
+                cache.popitem(last=False)
+        return entry
+
+    def _resolve_body(self, planet_id: str) -> Any:
+        """Return the skyfield body for a planet ID, or None if this adapter does not support it."""
+        body = self._body_cache.get(planet_id)
+        if body is None:
+            try:
+                body = self._get_body(planet_id)
+            except Exception:
+                body = None
+        return body
 
-    def _calc_lunar_node(self, t: any, dt_utc: datetime) -> Optional[PlanetPosition]:
+    def _calc_planet_positions_vec(self, body: Any, t_all: Any) -> list[Optional[PositionRow]]:
+        """
+        Calculate positions for a single body over a Time array.
+        
+        If the vectorized evaluation fails (e.g. one instant is outside the
+        kernel coverage), the instants are retried one at a time so that only
+        the failing ones are dropped.
+        
+        Args:
+            body: Skyfield body (from _resolve_body)
+            t_all: Time array of N datetimes
+            
+        Returns:
+            List of N (lon, lat, speed_lon, retrograde) rows (None for an instant
+            that could not be computed)
+        """
+        try:
+            return self._ecliptic_rows(body, t_all)
+        except Exception:
+            # Don't fail the entire calculation; a single instant has nothing
+            # left to retry
+            if len(t_all) == 1:
+                return [None]
+        
+        # One bad instant fails the whole vectorized call, so retry the
+        # instants one at a time
+        rows: list[Optional[PositionRow]] = []
+        for i in range(len(t_all)):
+            try:
+                rows.extend(self._ecliptic_rows(body, t_all[i:i + 1]))
+            except Exception:
+                rows.append(None)
+        return rows
+
+    def _ecliptic_rows(self, body: Any, t_all: Any) -> list[Optional[PositionRow]]:
+        """Evaluate a body's ecliptic-of-date rows over a Time array (raises on failure)."""
+        # Get positions relative to Earth (geocentric) for every sample at once,
+        # observing from the Earth position shared by all bodies at these times
+        earth_at, rotation = self._time_frame(t_all)
+        astrometric = earth_at.observe(body)
+        
+        # Rotate into the ecliptic of date with the shared matrix; the
+        # longitude rate comes from the analytic SPK velocity, so no second
+        # observe() is needed for speed
+        x, y, z = mxv(rotation, astrometric.xyz.au)
+        vx, vy, _ = mxv(rotation, astrometric.velocity.au_per_d)
+        
+        longitude = np.degrees(np.arctan2(y, x)) % 360
+        latitude = np.degrees(np.arctan2(z, np.hypot(x, y)))
+        speed_longitude = np.degrees((x * vy - y * vx) / (x * x + y * y))  # per day
+
+        # tolist() converts to Python floats/bools in one pass per column
+        return list(zip(
+            longitude.tolist(),
+            latitude.tolist(),
+            speed_longitude.tolist(),
+            (speed_longitude < 0).tolist(),
+        ))
+
+    def _calc_lunar_node(self, dt_utc: datetime) -> Optional[PlanetPosition]:
         """Calculate lunar north node position from moon's orbit."""
         try:
-            moon = self.eph['moon']
-            earth = self.eph['earth']
-            
-            # Get moon's position relative to Earth
-            astrometric = earth.at(t).observe(moon)
-            lat, lon, distance = astrometric.frame_latlon(ecliptic_frame)
-            
-            # Lunar node is where moon crosses ecliptic (latitude = 0)
-            # For simplicity, we'll use the ascending node approximation
-            # More accurate calculation would find the actual node crossing
-            
-            # Use Swiss Ephemeris for accurate node calculation
+            # Lunar node is where moon crosses ecliptic (latitude = 0);
+            # use Swiss Ephemeris for accurate true node calculation
             jd = _datetime_to_jd(dt_utc)
             result = swe.calc_ut(jd, swe.TRUE_NODE, swe.FLG_SWIEPH)
             if result and len(result) > 0:
@@ -368,7 +939,9 @@ class JplEphemerisAdapter:
             pass
         return None
 
-    def _calc_chiron_swiss(self, dt_utc: datetime, settings: EphemerisSettings) -> Optional[PlanetPosition]:
+    def _calc_chiron_swiss(
+        self, dt_utc: datetime, settings: JplSettings
+    ) -> Optional[PlanetPosition]:
         """
         Calculate Chiron position using Swiss Ephemeris (hybrid approach).
         
@@ -383,22 +956,22 @@ class JplEphemerisAdapter:
             PlanetPosition for Chiron or None if calculation fails
         """
         try:
-            jd = _datetime_to_jd(dt_utc)
-            
             # Configure flags based on settings
-            flags = swe.FLG_SWIEPH
-            if settings.get("zodiac_type") == "sidereal":
-                flags |= swe.FLG_SIDEREAL
-                # Set ayanamsa if specified
-                ayanamsa = settings.get("ayanamsa")
-                if ayanamsa:
-                    # Map ayanamsa to Swiss Ephemeris constant
-                    from crius_swiss.adapter import AYANAMSA_MAP, DEFAULT_AYANAMSA
-                    mode = AYANAMSA_MAP.get(ayanamsa.lower(), DEFAULT_AYANAMSA)
-                    swe.set_sid_mode(mode, 0, 0)
+            chiron_flags = _chiron_flags(settings.zodiac_type, settings.ayanamsa)
+            if chiron_flags is None:
+                return None
+            flags, sid_mode = chiron_flags
+            jd = _datetime_to_jd(dt_utc)
             
             # Calculate Chiron using Swiss Ephemeris
-            result = swe.calc_ut(jd, swe.CHIRON, flags)
+            if not flags & swe.FLG_SIDEREAL:
+                result = swe.calc_ut(jd, swe.CHIRON, flags)
+            else:
+                with _swe_state_lock:
+                    if sid_mode is not None:
+                        # Always set: other Swiss Ephemeris users may have changed it
+                        swe.set_sid_mode(sid_mode, 0, 0)
+                    result = swe.calc_ut(jd, swe.CHIRON, flags)
             if result and len(result) > 0:
                 positions = result[0]
                 longitude = positions[0] % 360
@@ -427,45 +1000,21 @@ class JplEphemerisAdapter:
         house_system_str: str,
     ) -> HousePositions:
         """Calculate house cusps and angles using Swiss Ephemeris."""
-        result = swe.houses_ex2(jd, lat, lon, house_system_bytes, swe.FLG_SWIEPH)
+        result = _compute_houses_cached(
+            round(jd, _HOUSES_JD_PRECISION), lat, lon, house_system_bytes
+        )
 
-        if not result or len(result) == 0:
+        if result is None:
             return {
                 "system": house_system_str,
                 "cusps": {},
                 "angles": {},
             }
 
-        cusps = result[0]
-        ascmc = result[1]
-
-        # Extract house cusps
-        cusps_dict: dict[str, float] = {}
-        
-        if len(cusps) == 12:
-            # Whole Sign: cusps are indices 0-11 for houses 1-12
-            for i in range(12):
-                cusps_dict[str(i + 1)] = cusps[i] % 360
-        else:
-            # Placidus or other: indices 1-12 are houses 1-12
-            for i in range(1, 13):
-                if i < len(cusps):
-                    cusps_dict[str(i)] = cusps[i] % 360
-
-        # Extract angles
-        asc = ascmc[0] % 360 if len(ascmc) > 0 else 0.0
-        mc = ascmc[1] % 360 if len(ascmc) > 1 else 0.0
-        ic = (mc + 180) % 360
-        dc = (asc + 180) % 360
+        cusps, angles = result
 
         return {
             "system": house_system_str,
-            "cusps": cusps_dict,
-            "angles": {
-                "asc": asc,
-                "mc": mc,
-                "ic": ic,
-                "dc": dc,
-            },
+            "cusps": dict(zip(_CUSP_LABELS, cusps)),
+            "angles": dict(zip(_ANGLE_LABELS, angles)),
         }
-
@@ -0,0 +1,36 @@
+"""
+Prefetch the JPL ephemeris kernel.
+
+Run at image build or install time so that the first adapter construction
+does not have to download the kernel:
+
+    crius-jpl-bootstrap
+    python -m crius_jpl.bootstrap
+"""
+
+import sys
+
+from ._data import DE430T_FILENAME, fetch_kernel
+
+
+def main() -> int:
+    """Download the DE430t kernel into the pooch cache and print its path."""
+    try:
+        path = fetch_kernel(DE430T_FILENAME)
+    except Exception as e:
+        print(f"Failed to fetch {DE430T_FILENAME}: {e}", file=sys.stderr)
+        return 1
+
+    if path is None:
+        print(
+            "pooch is not installed; install crius-jpl[pooch] to prefetch kernels.",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,8 @@
-"""Custom exceptions for crius-jpl."""
+"""Custom exceptions for crius-jpl.
+
+Default messages are built in ``__str__`` rather than ``__init__``, so raising
+and catching an exception without printing it stays cheap.
+"""
 
 
 class CriusJplError(Exception):
@@ -18,16 +22,21 @@ class EphemerisDownloadError(CriusJplError):
             message: Optional custom message
             url: Optional URL that failed to download
         """
+        self.message = message
         self.url = url
-        if message is None:
-            message = (
-                "Failed to download JPL ephemeris data.\n"
-                "This usually indicates a network connectivity issue.\n"
-                "Please check your internet connection and try again.\n"
-            )
-            if url:
-                message += f"\nFailed URL: {url}"
-        super().__init__(message)
+        super().__init__(*(() if message is None else (message,)))
+
+    def __str__(self) -> str:
+        if self.message is not None:
+            return self.message
+        message = (
+            "Failed to download JPL ephemeris data.\n"
+            "This usually indicates a network connectivity issue.\n"
+            "Please check your internet connection and try again.\n"
+        )
+        if self.url:
+            message += f"\nFailed URL: {self.url}"
+        return message
 
 
 class DateRangeError(CriusJplError):
@@ -40,17 +49,19 @@ class DateRangeError(CriusJplError):
         Args:
             date: Date that is out of range
             min_date: Minimum supported date (default: 1550-01-01)
-            max_date: Maximum supported date (default: 2650-12-31)
+            max_date: Maximum supported date (default: 2650-01-24)
         """
         self.date = date
         self.min_date = min_date or "1550-01-01"
-        self.max_date = max_date or "2650-12-31"
-        message = (
-            f"Date {date} is outside the supported JPL DE430t range.\n"
+        self.max_date = max_date or "2650-01-24"
+        super().__init__(date, min_date, max_date)
+
+    def __str__(self) -> str:
+        return (
+            f"Date {self.date} is outside the supported JPL DE430t range.\n"
             f"Supported range: {self.min_date} to {self.max_date}\n"
             f"For dates outside this range, consider using crius-swiss instead."
         )
-        super().__init__(message)
 
 
 class EphemerisLoadError(CriusJplError):
@@ -64,10 +75,14 @@ class EphemerisLoadError(CriusJplError):
             message: Optional custom message
             filepath: Optional path to file that failed to load
         """
+        self.message = message
         self.filepath = filepath
-        if message is None:
-            message = "Failed to load JPL ephemeris data."
-            if filepath:
-                message += f"\nFile: {filepath}"
-        super().__init__(message)
-
+        super().__init__(*(() if message is None else (message,)))
+
+    def __str__(self) -> str:
+        if self.message is not None:
+            return self.message
+        message = "Failed to load JPL ephemeris data."
+        if self.filepath:
+            message += f"\nFile: {self.filepath}"
+        return message
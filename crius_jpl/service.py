@@ -4,26 +4,106 @@ Service entrypoint for JPL Ephemeris adapter.
 Provides a factory function to create and configure the adapter instance.
 """
 
+import functools
 import os
+import threading
 from typing import Optional
-from .adapter import JplEphemerisAdapter
+from .adapter import JplEphemerisAdapter, _calc_positions_lru
+from .exceptions import EphemerisDownloadError
+from ._data import DE430T_FILENAME, fetch_kernel, kernel_url
+
+# Adapters per resolved Swiss Ephemeris path, oldest first. Lookups are lock-free;
+# the lock is only taken on a miss, so that concurrent first calls build one
+# adapter per path instead of each fetching and opening the kernel (loading is
+# idempotent, so this only saves the duplicate work)
+_ADAPTER_CACHE_SIZE = 8
+_adapters: dict[str, JplEphemerisAdapter] = {}
+_adapter_lock = threading.Lock()
+
+# Explicit default set with set_default_ephemeris_path(), if any
+_default_ephemeris_path_override: Optional[str] = None
+
+
+@functools.cache
+def _get_default_ephemeris_path() -> str:
+    """Resolve the default Swiss Ephemeris path (resolved once, on first use)."""
+    if _default_ephemeris_path_override is not None:
+        return _default_ephemeris_path_override
+    return os.getenv("SWISS_EPHEMERIS_PATH", "/usr/local/share/swisseph")
+
+
+def set_default_ephemeris_path(ephemeris_path: Optional[str]) -> None:
+    """
+    Set the Swiss Ephemeris path used when create_jpl_adapter gets no path.
+    
+    Args:
+        ephemeris_path: Path to use, or None to go back to SWISS_EPHEMERIS_PATH
+                       (re-read on next use) or the default path
+    """
+    global _default_ephemeris_path_override
+    
+    _default_ephemeris_path_override = ephemeris_path
+    _get_default_ephemeris_path.cache_clear()
+
+
+def _build(ephemeris_path: str) -> JplEphemerisAdapter:
+    """Construct an adapter for a resolved Swiss Ephemeris path."""
+    # Make sure the kernel is present before the adapter tries to load it, so a
+    # failed download surfaces with its URL (no-op if it is already on disk
+    # or pooch is not installed)
+    try:
+        fetch_kernel(DE430T_FILENAME)
+    except Exception as e:
+        raise EphemerisDownloadError(url=kernel_url(DE430T_FILENAME)) from e
+    
+    return JplEphemerisAdapter(ephemeris_path=ephemeris_path)
 
 
 def create_jpl_adapter(ephemeris_path: Optional[str] = None) -> JplEphemerisAdapter:
     """
     Create a configured JPL Ephemeris adapter instance.
     
+    Adapters are memoized per resolved ephemeris path, so repeated calls share
+    one adapter, timescale and loaded kernel. Use
+    ``create_jpl_adapter.cache_clear()`` to drop the cached instances.
+    
     Args:
         ephemeris_path: Optional path to Swiss Ephemeris data files (for houses).
-                       If None, uses SWISS_EPHEMERIS_PATH env var or default path.
+                       If None, uses the path from set_default_ephemeris_path(),
+                       else SWISS_EPHEMERIS_PATH env var (read once) or default path.
     
     Returns:
         Configured JplEphemerisAdapter instance.
+    
+    Raises:
+        EphemerisDownloadError: If the JPL kernel is missing and cannot be downloaded
     """
+    # Resolve the default before the cache lookup so that equivalent calls
+    # share one entry
     if ephemeris_path is None:
-        ephemeris_path = os.getenv("SWISS_EPHEMERIS_PATH", "/usr/local/share/swisseph")
+        ephemeris_path = _get_default_ephemeris_path()
     
-    return JplEphemerisAdapter(ephemeris_path=ephemeris_path)
+    adapter = _adapters.get(ephemeris_path)
+    if adapter is not None:
+        return adapter
+    
+    with _adapter_lock:
+        adapter = _adapters.get(ephemeris_path)
+        if adapter is None:
+            adapter = _build(ephemeris_path)
+            _adapters[ephemeris_path] = adapter
+            if len(_adapters) > _ADAPTER_CACHE_SIZE:
+                del _adapters[next(iter(_adapters))]
+        return adapter
+
+
+def _clear_adapters() -> None:
+    """Drop the cached adapters."""
+    with _adapter_lock:
+        _adapters.clear()
+
+
+create_jpl_adapter.cache_clear = _clear_adapters  # type: ignore[attr-defined]
 
 
 def calc_positions(
@@ -35,8 +115,10 @@ def calc_positions(
     """
     Calculate positions using JPL ephemeris (convenience function).
     
-    This is a thin wrapper around JplEphemerisAdapter.calc_positions that
-    creates an adapter instance and calls calc_positions.
+    This is a thin wrapper around JplEphemerisAdapter.calc_positions_cached
+    that reuses the cached adapter from create_jpl_adapter. Results are
+    memoized per whole second and returned as copies; use
+    ``calc_positions.cache_clear()`` to drop them.
     
     Args:
         dt_utc: UTC datetime for calculation
@@ -48,5 +130,7 @@ def calc_positions(
         LayerPositions dict with planets and optionally houses
     """
     adapter = create_jpl_adapter(ephemeris_path=ephemeris_path)
-    return adapter.calc_positions(dt_utc, location, settings)
+    return adapter.calc_positions_cached(dt_utc, location, settings)
+
 
+calc_positions.cache_clear = _calc_positions_lru.cache_clear  # type: ignore[attr-defined]
@@ -0,0 +1,133 @@
+"""
+Immutable settings and location types for crius-jpl.
+
+The adapter accepts the crius-ephemeris-core ``EphemerisSettings`` and
+``GeoLocation`` dicts as well as these types, and converts dicts once at the
+call boundary. Instances are hashable, so they can be used directly as cache
+keys, and are also read-only mappings of the TypedDict fields
+(``settings["house_system"]``, ``.get()``, ``.items()``, iteration, ``len()``,
+``dict(settings)``) for code written against the TypedDicts.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Iterator, Mapping, Optional, Union
+
+
+class _MappingCompat(Mapping[str, Any]):
+    """
+    Read-only mapping of the fields listed in _KEYS.
+
+    Mapping supplies keys(), items() and values(); equality and hashing stay
+    the dataclass ones, so instances are not equal to dicts.
+    """
+
+    __slots__ = ()
+    _KEYS: ClassVar[tuple[str, ...]] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or default if it is not a field."""
+        return getattr(self, key) if key in self._KEYS else default
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the equivalent crius-ephemeris-core dict."""
+        return {key: getattr(self, key) for key in self._KEYS}
+
+
+@dataclass(frozen=True, slots=True)
+class JplSettings(_MappingCompat):
+    """
+    Ephemeris calculation settings.
+
+    include_objects is normalized to lowercase IDs without duplicates (in
+    request order), and include_set holds the same IDs for O(1) membership
+    tests.
+    """
+
+    zodiac_type: str = "tropical"
+    ayanamsa: Optional[str] = None
+    house_system: str = "placidus"
+    include_objects: tuple[str, ...] = ()
+    include_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    _KEYS: ClassVar[tuple[str, ...]] = (
+        "zodiac_type",
+        "ayanamsa",
+        "house_system",
+        "include_objects",
+    )
+
+    def __post_init__(self) -> None:
+        include_objects = tuple(dict.fromkeys(obj_id.lower() for obj_id in self.include_objects))
+        object.__setattr__(self, "include_objects", include_objects)
+        object.__setattr__(self, "include_set", frozenset(include_objects))
+
+    @classmethod
+    def from_dict(cls, settings: Mapping[str, Any]) -> "JplSettings":
+        """
+        Build settings from an EphemerisSettings dict.
+
+        Args:
+            settings: Mapping with zodiac_type, ayanamsa, house_system and include_objects
+
+        Returns:
+            JplSettings instance (missing keys use the defaults)
+        """
+        return cls(
+            zodiac_type=settings.get("zodiac_type", "tropical"),
+            ayanamsa=settings.get("ayanamsa"),
+            house_system=settings.get("house_system", "placidus"),
+            include_objects=tuple(settings.get("include_objects", ())),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class JplLocation(_MappingCompat):
+    """Geographic location in degrees."""
+
+    lat: float
+    lon: float
+
+    _KEYS: ClassVar[tuple[str, ...]] = ("lat", "lon")
+
+    @classmethod
+    def from_dict(cls, location: Mapping[str, Any]) -> "JplLocation":
+        """
+        Build a location from a GeoLocation dict.
+
+        Args:
+            location: Mapping with 'lat' and 'lon'
+
+        Returns:
+            JplLocation instance
+        """
+        return cls(lat=location["lat"], lon=location["lon"])
+
+
+def as_settings(settings: Union[JplSettings, Mapping[str, Any]]) -> JplSettings:
+    """Return settings as a JplSettings, converting dicts."""
+    if isinstance(settings, JplSettings):
+        return settings
+    return JplSettings.from_dict(settings)
+
+
+def as_location(location: Union[JplLocation, Mapping[str, Any], None]) -> Optional[JplLocation]:
+    """Return a location as a JplLocation, converting dicts (None or {} means no location)."""
+    if isinstance(location, JplLocation):
+        return location
+    if not location:
+        return None
+    return JplLocation.from_dict(location)
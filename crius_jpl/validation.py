@@ -1,13 +1,44 @@
 """Validation utilities for crius-jpl."""
 
-from datetime import datetime
-from typing import Tuple
+from datetime import datetime, timezone
+from typing import Sequence, Tuple
+
+import numpy as np
 
 from .exceptions import DateRangeError
 
-# JPL DE430t supported date range
+# JPL DE430t supported date range, as UTC instants (both inclusive). The kernel
+# covers 1549-12-31 to 2650-01-25 TT (proleptic Gregorian, as datetime uses);
+# the range is the whole UTC days inside it, up to 2650-01-24 00:00
 JPL_MIN_DATE = datetime(1550, 1, 1)
-JPL_MAX_DATE = datetime(2650, 12, 31)
+JPL_MAX_DATE = datetime(2650, 1, 24)
+
+# The same bounds as POSIX timestamps (UTC), for fast comparisons
+JPL_MIN_TS = JPL_MIN_DATE.replace(tzinfo=timezone.utc).timestamp()
+JPL_MAX_TS = JPL_MAX_DATE.replace(tzinfo=timezone.utc).timestamp()
+
+# The same bounds as TT Julian Dates, compared directly against skyfield's
+# Time.tt: ts.utc(JPL_MIN_DATE).tt and ts.utc(JPL_MAX_DATE).tt with skyfield's
+# builtin timescale (Delta T of about 3 and 31 minutes), so the adapter and
+# check_date_range accept the same datetimes
+JPL_MIN_JD = 2287185.5004882407
+JPL_MAX_JD = 2688975.500800741
+
+# Bounds as reported in DateRangeError
+_JPL_MIN_ISO = JPL_MIN_DATE.isoformat()
+_JPL_MAX_ISO = JPL_MAX_DATE.isoformat()
+
+
+def _to_timestamp(dt: datetime) -> float:
+    """Return the POSIX timestamp of a datetime, treating naive values as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _is_in_range(dt: datetime) -> bool:
+    """Return whether a date is within the supported range, without building a message."""
+    return JPL_MIN_TS <= _to_timestamp(dt) <= JPL_MAX_TS
 
 
 def validate_date_range(dt: datetime) -> Tuple[bool, str]:
@@ -15,18 +46,64 @@ def validate_date_range(dt: datetime) -> Tuple[bool, str]:
     Validate that a date is within the JPL DE430t supported range.
 
     Args:
-        dt: Datetime to validate
+        dt: Datetime to validate (naive datetimes are treated as UTC)
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if dt < JPL_MIN_DATE:
+    if _is_in_range(dt):
+        return True, ""
+    
+    # Out of range: only now build the message
+    if _to_timestamp(dt) < JPL_MIN_TS:
         return False, f"Date {dt} is before minimum supported date {JPL_MIN_DATE}"
     
-    if dt > JPL_MAX_DATE:
-        return False, f"Date {dt} is after maximum supported date {JPL_MAX_DATE}"
+    return False, f"Date {dt} is after maximum supported date {JPL_MAX_DATE}"
+
+
+def _is_jd_in_range(jd: float) -> bool:
+    """Return whether a TT Julian Date is within the supported range."""
+    return JPL_MIN_JD <= jd <= JPL_MAX_JD
+
+
+def validate_jd_range(jd: float) -> Tuple[bool, str]:
+    """
+    Validate that a TT Julian Date is within the JPL DE430t supported range.
+
+    Args:
+        jd: Julian Date (TT, as in skyfield's Time.tt) to validate
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if _is_jd_in_range(jd):
+        return True, ""
+    
+    if jd < JPL_MIN_JD:
+        return False, f"Julian Date {jd} is before minimum supported date {JPL_MIN_JD}"
     
-    return True, ""
+    return False, f"Julian Date {jd} is after maximum supported date {JPL_MAX_JD}"
+
+
+def _check_jd_range(jds: np.ndarray, dts: Sequence[datetime]) -> None:
+    """
+    Raise DateRangeError for the first datetime whose TT Julian Date is out of range.
+
+    Args:
+        jds: TT Julian Dates of dts (e.g. Time.tt of the batch's Time array)
+        dts: The datetimes, reported in the error
+    """
+    if len(jds) == 1:
+        # Scalar comparison for the common single-datetime call
+        if _is_jd_in_range(jds.item(0)):
+            return
+        index = 0
+    else:
+        out_of_range = (jds < JPL_MIN_JD) | (jds > JPL_MAX_JD)
+        if not out_of_range.any():
+            return
+        index = int(np.argmax(out_of_range))
+    raise DateRangeError(dts[index], min_date=_JPL_MIN_ISO, max_date=_JPL_MAX_ISO)
 
 
 def check_date_range(dt: datetime, raise_error: bool = True) -> bool:
@@ -43,11 +120,10 @@ def check_date_range(dt: datetime, raise_error: bool = True) -> bool:
     Raises:
         DateRangeError: If date is out of range and raise_error is True
     """
-    is_valid, error_msg = validate_date_range(dt)
-    
-    if not is_valid:
+    # The message from validate_date_range is never used here, so only test the range
+    if not _is_in_range(dt):
         if raise_error:
-            raise DateRangeError(dt, min_date=JPL_MIN_DATE.isoformat(), max_date=JPL_MAX_DATE.isoformat())
+            raise DateRangeError(dt, min_date=_JPL_MIN_ISO, max_date=_JPL_MAX_ISO)
         return False
     
     return True
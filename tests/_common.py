@@ -0,0 +1,14 @@
+"""Constants shared across the crius-jpl test suite."""
+
+from crius_jpl import JplSettings
+
+# Planets requested by the default test settings
+DEFAULT_INCLUDE = ("sun", "moon", "mercury", "venus", "mars")
+
+# Immutable, so one instance can be shared by every test
+DEFAULT_SETTINGS = JplSettings(
+    zodiac_type="tropical",
+    ayanamsa=None,
+    house_system="placidus",
+    include_objects=DEFAULT_INCLUDE,
+)
@@ -5,28 +5,25 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 
-from crius_ephemeris_core import EphemerisSettings, GeoLocation
-from crius_jpl import JplEphemerisAdapter
+# Keep test runs from writing to the user positions cache; tests that need the
+# cache pass cache_dir explicitly
+os.environ.setdefault("CRIUS_JPL_CACHE_DISABLE", "1")
+
+from crius_jpl import JplEphemerisAdapter, JplLocation, JplSettings
+
+from ._common import DEFAULT_SETTINGS
 
 
 @pytest.fixture
-def sample_settings() -> EphemerisSettings:
+def sample_settings() -> JplSettings:
     """Sample ephemeris settings for testing."""
-    return {
-        "zodiac_type": "tropical",
-        "ayanamsa": None,
-        "house_system": "placidus",
-        "include_objects": ["sun", "moon", "mercury", "venus", "mars"],
-    }
+    return DEFAULT_SETTINGS
 
 
 @pytest.fixture
-def sample_location() -> GeoLocation:
+def sample_location() -> JplLocation:
     """Sample geographic location (New York)."""
-    return {
-        "lat": 40.7128,
-        "lon": -74.0060,
-    }
+    return JplLocation(lat=40.7128, lon=-74.0060)
 
 
 @pytest.fixture
@@ -1,9 +1,20 @@
 """Tests for JPL Ephemeris adapter."""
 
 import pytest
-from datetime import datetime, timezone
-from crius_jpl import JplEphemerisAdapter, create_jpl_adapter
+import swisseph as swe
+from datetime import date, datetime, timedelta, timezone
+from crius_jpl import (
+    JplEphemerisAdapter,
+    JplLocation,
+    JplSettings,
+    create_jpl_adapter,
+    load_ephemeris_to_cache,
+)
 from crius_ephemeris_core import EphemerisSettings, GeoLocation
+from crius_jpl._ephemeris_cache import PositionsCache
+from crius_jpl.adapter import _datetime_to_jd
+
+from ._common import DEFAULT_INCLUDE, DEFAULT_SETTINGS
 
 
 @pytest.fixture
@@ -13,23 +24,15 @@ def adapter():
 
 
 @pytest.fixture
-def sample_settings() -> EphemerisSettings:
+def sample_settings() -> JplSettings:
     """Sample ephemeris settings."""
-    return {
-        "zodiac_type": "tropical",
-        "ayanamsa": None,
-        "house_system": "placidus",
-        "include_objects": ["sun", "moon", "mercury", "venus", "mars"],
-    }
+    return DEFAULT_SETTINGS
 
 
 @pytest.fixture
-def sample_location() -> GeoLocation:
+def sample_location() -> JplLocation:
     """Sample geographic location (New York)."""
-    return {
-        "lat": 40.7128,
-        "lon": -74.0060,
-    }
+    return JplLocation(lat=40.7128, lon=-74.0060)
 
 
 def test_adapter_initialization():
@@ -50,6 +53,33 @@ def test_adapter_with_custom_path(monkeypatch, tmp_path):
     assert adapter.ephemeris_path == test_path
 
 
+def test_adapter_with_body_subset(sample_settings):
+    """Test adapter restricted to a subset of JPL bodies."""
+    adapter = JplEphemerisAdapter(bodies=["sun", "moon"])
+    dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    
+    positions = adapter.calc_positions(dt, None, sample_settings)
+    
+    # Only the bodies kept in the restricted kernel are calculated
+    assert set(positions["planets"]) == {"sun", "moon"}
+    full = JplEphemerisAdapter().calc_positions(dt, None, sample_settings)
+    assert positions["planets"]["sun"] == full["planets"]["sun"]
+
+
+def test_body_subset_ignores_shared_cache(tmp_path, sample_settings):
+    """Test that a restricted adapter does not serve other bodies from a shared cache."""
+    cache_dir = str(tmp_path / "cache")
+    dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    
+    full = JplEphemerisAdapter(cache_dir=cache_dir).calc_positions(dt, None, sample_settings)
+    assert "venus" in full["planets"]
+    
+    restricted = JplEphemerisAdapter(bodies=["sun"], cache_dir=cache_dir)
+    positions = restricted.calc_positions(dt, None, sample_settings)
+    assert set(positions["planets"]) == {"sun"}
+    assert positions["planets"]["sun"] == full["planets"]["sun"]
+
+
 def test_calc_positions_planets_only(adapter, sample_settings):
     """Test calculating planetary positions without houses."""
     dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -114,12 +144,12 @@ def test_calc_positions_with_houses(adapter, sample_settings, sample_location):
 
 def test_calc_positions_lunar_nodes(adapter, sample_location):
     """Test calculating lunar nodes."""
-    settings: EphemerisSettings = {
-        "zodiac_type": "tropical",
-        "ayanamsa": None,
-        "house_system": "placidus",
-        "include_objects": ["north_node", "south_node"],
-    }
+    settings = JplSettings(
+        zodiac_type="tropical",
+        ayanamsa=None,
+        house_system="placidus",
+        include_objects=("north_node", "south_node"),
+    )
     
     dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
     positions = adapter.calc_positions(dt, sample_location, settings)
@@ -135,8 +165,25 @@ def test_calc_positions_lunar_nodes(adapter, sample_location):
     assert 0 <= south_node["lon"] < 360
     
     # South node should be approximately 180 degrees from north node
-    diff = abs((south_node["lon"] - north_node["lon"]) % 360)
-    assert diff < 1.0 or diff > 359.0  # Allow for small calculation differences
+    diff = (south_node["lon"] - north_node["lon"]) % 360
+    assert abs(diff - 180) < 1.0  # Allow for small calculation differences
+    assert south_node["speed_lon"] == north_node["speed_lon"]
+
+
+def test_calc_positions_south_node_only(adapter):
+    """Test that South Node is returned without requesting North Node."""
+    settings = JplSettings(
+        zodiac_type="tropical",
+        ayanamsa=None,
+        house_system="placidus",
+        include_objects=("south_node",),
+    )
+    
+    dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    positions = adapter.calc_positions(dt, None, settings)
+    
+    assert list(positions["planets"]) == ["south_node"]
+    assert 0 <= positions["planets"]["south_node"]["lon"] < 360
 
 
 def test_calc_positions_multiple_timestamps(adapter, sample_settings, sample_location):
@@ -178,12 +225,12 @@ def test_different_house_systems(adapter, sample_location):
     house_systems = ["placidus", "whole_sign", "koch", "equal"]
     
     for house_system in house_systems:
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": house_system,
-            "include_objects": ["sun"],
-        }
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system=house_system,
+            include_objects=("sun",),
+        )
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         positions = adapter.calc_positions(dt, sample_location, settings)
@@ -191,3 +238,164 @@ def test_different_house_systems(adapter, sample_location):
         assert positions["houses"] is not None
         assert positions["houses"]["system"] == house_system
 
+
+
+def test_calc_positions_batch_matches_single(adapter, sample_settings, sample_location):
+    """Test that batched calculation matches per-datetime calculation."""
+    timestamps = [
+        datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        datetime(2024, 6, 15, 18, 30, 0, tzinfo=timezone.utc),
+        datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+    ]
+    
+    batch = adapter.calc_positions_batch(timestamps, sample_location, sample_settings)
+    
+    assert len(batch) == len(timestamps)
+    for dt, positions in zip(timestamps, batch):
+        single = adapter.calc_positions(dt, sample_location, sample_settings)
+        assert positions["houses"] == single["houses"]
+        for planet_id, pos in single["planets"].items():
+            assert positions["planets"][planet_id]["lon"] == pytest.approx(pos["lon"])
+            assert positions["planets"][planet_id]["speed_lon"] == pytest.approx(pos["speed_lon"])
+
+
+def test_calc_positions_batch_drops_only_failing_instants(adapter, sample_settings, monkeypatch):
+    """Test that an instant the kernel cannot evaluate only loses its own planets."""
+    good = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    bad = datetime(2024, 1, 2, 12, 0, 0, tzinfo=timezone.utc)
+    bad_tt = adapter.ts.from_datetime(bad).tt
+    ecliptic_rows = adapter._ecliptic_rows
+    
+    def failing_rows(body, t):
+        if (abs(t.tt - bad_tt) < 1e-9).any():
+            raise ValueError("instant outside kernel coverage")
+        return ecliptic_rows(body, t)
+    
+    monkeypatch.setattr(adapter, "_ecliptic_rows", failing_rows)
+    batch = adapter.calc_positions_batch([good, bad], None, sample_settings)
+    single = adapter.calc_positions(good, None, sample_settings)
+    
+    assert batch[0]["planets"] == single["planets"]
+    assert "sun" in batch[0]["planets"]
+    assert "sun" not in batch[1]["planets"]
+
+
+def test_calc_positions_converts_aware_datetimes(adapter, sample_settings, sample_location):
+    """Test that aware datetimes are calculated at their UTC instant, and naive ones as UTC."""
+    dt_utc = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    dt_local = dt_utc.astimezone(timezone(timedelta(hours=5)))
+    expected = adapter.calc_positions(dt_utc, sample_location, sample_settings)
+    
+    assert adapter.calc_positions(dt_local, sample_location, sample_settings) == expected
+    assert adapter.calc_positions_cached(dt_local, sample_location, sample_settings) == expected
+    naive = adapter.calc_positions(dt_utc.replace(tzinfo=None), sample_location, sample_settings)
+    assert naive == expected
+
+
+def test_calc_positions_accepts_dicts(adapter, sample_settings, sample_location):
+    """Test that EphemerisSettings/GeoLocation dicts match the dataclass inputs."""
+    dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    settings_dict: EphemerisSettings = {
+        "zodiac_type": "tropical",
+        "ayanamsa": None,
+        "house_system": "placidus",
+        "include_objects": list(DEFAULT_INCLUDE),
+    }
+    location_dict: GeoLocation = {"lat": 40.7128, "lon": -74.0060}
+    
+    assert JplSettings.from_dict(settings_dict) == sample_settings
+    assert JplLocation.from_dict(location_dict) == sample_location
+    assert adapter.calc_positions(dt, location_dict, settings_dict) == adapter.calc_positions(
+        dt, sample_location, sample_settings
+    )
+
+
+def test_settings_dict_compat(sample_settings, sample_location):
+    """Test read-only dict-style access on the settings and location types."""
+    assert sample_settings["house_system"] == "placidus"
+    assert sample_settings.get("ayanamsa") is None
+    assert sample_settings.get("missing", "default") == "default"
+    assert "include_objects" in sample_settings
+    assert dict(sample_location) == {"lat": 40.7128, "lon": -74.0060}
+    assert [key for key in sample_settings] == list(JplSettings._KEYS)
+    assert len(sample_settings) == 4
+    assert dict(sample_settings.items()) == sample_settings.to_dict()
+    assert list(sample_location.values()) == [40.7128, -74.0060]
+    assert JplSettings.from_dict(sample_settings.to_dict()) == sample_settings
+    with pytest.raises(KeyError):
+        sample_settings["include_set"]
+
+
+def test_settings_normalize_include_objects():
+    """Test that include_objects is lowercased and deduplicated in order."""
+    settings = JplSettings(include_objects=["Sun", "moon", "sun", "North_Node"])
+    assert settings.include_objects == ("sun", "moon", "north_node")
+    assert settings.include_set == frozenset({"sun", "moon", "north_node"})
+    assert settings == JplSettings(include_objects=("sun", "moon", "north_node"))
+
+
+@pytest.mark.parametrize("dt", [
+    datetime(1550, 6, 15, 6, 30, 0),
+    datetime(1582, 12, 31, 0, 0, 0),
+    datetime(1583, 1, 1, 0, 0, 0),
+    datetime(1600, 2, 29, 18, 0, 0),
+    datetime(2000, 1, 1, 12, 0, 0),
+    datetime(2024, 12, 31, 23, 59, 59),
+    datetime(2650, 1, 24, 0, 0, 0),
+])
+def test_datetime_to_jd_matches_swe_julday(dt):
+    """Test that both Julian Day branches agree with swe.julday."""
+    hour = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
+    expected = swe.julday(dt.year, dt.month, dt.day, hour, swe.GREG_CAL)
+    assert _datetime_to_jd(dt) == pytest.approx(expected, abs=1e-9)
+
+
+def test_calc_positions_batch_empty(adapter, sample_settings):
+    """Test that an empty batch returns an empty list."""
+    assert adapter.calc_positions_batch([], None, sample_settings) == []
+
+
+def test_positions_cache_prewarm(tmp_path, sample_settings):
+    """Test that cached positions match freshly calculated ones."""
+    timestamps = [
+        datetime(2024, 1, 1, hour, 0, 0, tzinfo=timezone.utc) for hour in range(0, 24, 6)
+    ]
+    cached_adapter = JplEphemerisAdapter(cache_dir=str(tmp_path / "cache"))
+    
+    assert cached_adapter.prewarm(timestamps, ["sun", "moon"]) == len(timestamps)
+    
+    cached = cached_adapter.calc_positions_batch(timestamps, None, sample_settings)
+    fresh = JplEphemerisAdapter().calc_positions_batch(timestamps, None, sample_settings)
+    assert cached == fresh
+
+
+def test_prewarm_without_cache(adapter):
+    """Test that prewarm is a no-op when the positions cache is disabled."""
+    if adapter._positions_cache is not None:
+        pytest.skip("positions cache is enabled")
+    dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert adapter.prewarm([dt]) == 0
+
+
+def test_positions_cache_day_files(tmp_path):
+    """Test that cached positions are written per day and can be reloaded."""
+    cache_dir = str(tmp_path / "cache")
+    cached_adapter = JplEphemerisAdapter(cache_dir=cache_dir)
+    dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    
+    assert cached_adapter.prewarm([dt], ["sun", "moon"]) == 1
+    assert (tmp_path / "cache" / "2024-01-01.json").exists()
+    assert load_ephemeris_to_cache(dt.date(), cache_dir=cache_dir) == 2
+
+
+def test_positions_cache_bounds_day_rows(tmp_path):
+    """Test that a day stops taking new positions once it holds max_day_rows."""
+    cache = PositionsCache(str(tmp_path), max_day_rows=3)
+    jd = 2460311.0  # 2024-01-01 12:00 TT
+    row = (1.0, 0.0, 1.0, False)
+    
+    cache.put_many("sun", [(jd + i / 86400.0, row) for i in range(5)])
+    cache.flush()
+    
+    assert cache.get_many("sun", [jd, jd + 2 / 86400.0, jd + 3 / 86400.0]) == [row, row, None]
+    assert PositionsCache(str(tmp_path)).load_day(date(2024, 1, 1)) == 3
@@ -3,8 +3,9 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 
-from crius_ephemeris_core import EphemerisSettings, GeoLocation
-from crius_jpl import JplEphemerisAdapter
+from crius_jpl import JplEphemerisAdapter, JplLocation, JplSettings
+
+from ._common import DEFAULT_SETTINGS
 
 
 @pytest.mark.integration
@@ -21,17 +22,9 @@ class TestIntegration:
 
     def test_end_to_end_calculation(self, adapter):
         """Test complete end-to-end calculation flow."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun", "moon", "mercury", "venus", "mars"],
-        }
-        
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        settings = DEFAULT_SETTINGS
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         positions = adapter.calc_positions(dt, location, settings)
@@ -57,17 +50,14 @@ class TestIntegration:
 
     def test_multiple_consecutive_calculations(self, adapter):
         """Test multiple consecutive calculations."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun"],
-        }
-        
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system="placidus",
+            include_objects=("sun",),
+        )
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         # Calculate for multiple dates
         dates = [
@@ -87,17 +77,17 @@ class TestIntegration:
 
     def test_different_locations(self, adapter):
         """Test calculations for different locations."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun"],
-        }
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system="placidus",
+            include_objects=("sun",),
+        )
         
         locations = [
-            {"lat": 40.7128, "lon": -74.0060},  # New York
-            {"lat": 51.5074, "lon": -0.1278},   # London
-            {"lat": 35.6762, "lon": 139.6503},  # Tokyo
+            JplLocation(lat=40.7128, lon=-74.0060),  # New York
+            JplLocation(lat=51.5074, lon=-0.1278),   # London
+            JplLocation(lat=35.6762, lon=139.6503),  # Tokyo
         ]
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -114,17 +104,14 @@ class TestIntegration:
 
     def test_time_series_calculation(self, adapter):
         """Test calculating positions over a time series."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun", "moon"],
-        }
-        
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system="placidus",
+            include_objects=("sun", "moon"),
+        )
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         # Calculate for every hour over a day
         base_dt = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
@@ -145,17 +132,14 @@ class TestIntegration:
 
     def test_date_range_boundaries(self, adapter):
         """Test calculations at date range boundaries."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun"],
-        }
-        
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system="placidus",
+            include_objects=("sun",),
+        )
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         # Test near boundaries (JPL DE430t supports 1550-2650 CE)
         test_dates = [
@@ -4,8 +4,11 @@ import pytest
 import time
 from datetime import datetime, timezone, timedelta
 
-from crius_ephemeris_core import EphemerisSettings, GeoLocation
-from crius_jpl import JplEphemerisAdapter
+import numpy as np
+
+from crius_jpl import JplEphemerisAdapter, JplLocation, JplSettings
+
+from ._common import DEFAULT_SETTINGS
 
 
 @pytest.mark.performance
@@ -22,23 +25,18 @@ class TestPerformance:
 
     def test_single_calculation_performance(self, adapter):
         """Test performance of single calculation."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun", "moon", "mercury", "venus", "mars"],
-        }
-        
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        settings = DEFAULT_SETTINGS
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         
-        start = time.time()
+        # Warm up lazily initialized skyfield/numpy code paths
+        adapter.calc_positions(dt, location, settings)
+        
+        start = time.perf_counter_ns()
         positions = adapter.calc_positions(dt, location, settings)
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         
         # Should complete in reasonable time (< 1 second for single calculation)
         assert elapsed < 1.0
@@ -46,60 +44,80 @@ class TestPerformance:
 
     def test_multiple_calculations_performance(self, adapter):
         """Test performance of multiple calculations."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun", "moon"],
-        }
-        
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system="placidus",
+            include_objects=("sun", "moon"),
+        )
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         # Calculate for 100 different dates
         base_dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         dates = [base_dt + timedelta(days=i) for i in range(100)]
         
-        start = time.time()
+        adapter.calc_positions(dates[0], location, settings)  # warmup
+        
         results = []
-        for dt in dates:
+        latencies = np.empty(len(dates))
+        for i, dt in enumerate(dates):
+            start = time.perf_counter_ns()
             positions = adapter.calc_positions(dt, location, settings)
+            latencies[i] = (time.perf_counter_ns() - start) / 1e9
             results.append(positions)
-        elapsed = time.time() - start
         
         # Should complete 100 calculations in reasonable time
-        # Average should be < 0.1 seconds per calculation
+        # Median should be < 0.1 seconds per calculation (robust to single stalls)
+        median_time = float(np.median(latencies))
+        assert median_time < 0.1, f"Median calculation time too slow: {median_time:.3f}s"
+        assert len(results) == 100
+
+    def test_batch_calculation_performance(self, adapter):
+        """Test performance of one batched calculation over many dates."""
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system="placidus",
+            include_objects=("sun", "moon"),
+        )
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
+        
+        # Same 100 dates as above, evaluated in one vectorized pass per body
+        base_dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        dates = [base_dt + timedelta(days=i) for i in range(100)]
+        
+        adapter.calc_positions_batch(dates[:1], location, settings)  # warmup
+        
+        start = time.perf_counter_ns()
+        results = adapter.calc_positions_batch(dates, location, settings)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        
         avg_time = elapsed / 100
-        assert avg_time < 0.1, f"Average calculation time too slow: {avg_time:.3f}s"
+        assert avg_time < 0.01, f"Average batched calculation time too slow: {avg_time:.4f}s"
         assert len(results) == 100
 
     def test_body_cache_performance(self, adapter):
         """Test that body cache improves performance."""
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun", "moon", "mercury", "venus", "mars"],
-        }
-        
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        settings = DEFAULT_SETTINGS
+        
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         
+        # Warm up lazily initialized skyfield/numpy code paths
+        adapter.calc_positions(dt + timedelta(days=1), location, settings)
+        
         # First calculation (cache miss)
-        start1 = time.time()
+        start1 = time.perf_counter_ns()
         positions1 = adapter.calc_positions(dt, location, settings)
-        elapsed1 = time.time() - start1
+        elapsed1 = (time.perf_counter_ns() - start1) / 1e9
         
         # Second calculation with same settings (should benefit from body cache)
-        start2 = time.time()
+        start2 = time.perf_counter_ns()
         positions2 = adapter.calc_positions(dt, location, settings)
-        elapsed2 = time.time() - start2
+        elapsed2 = (time.perf_counter_ns() - start2) / 1e9
         
         # Results should be identical
         assert positions1["planets"]["sun"]["lon"] == positions2["planets"]["sun"]["lon"]
@@ -110,23 +128,22 @@ class TestPerformance:
 
     def test_skyfield_loader_reuse(self, adapter):
         """Test that skyfield loader is reused efficiently."""
-        # The adapter should reuse the same timescale and ephemeris loader
-        # This is tested implicitly by checking that multiple calculations work
+        # The adapters should reuse the same timescale and ephemeris loader
         
-        settings: EphemerisSettings = {
-            "zodiac_type": "tropical",
-            "ayanamsa": None,
-            "house_system": "placidus",
-            "include_objects": ["sun"],
-        }
+        settings = JplSettings(
+            zodiac_type="tropical",
+            ayanamsa=None,
+            house_system="placidus",
+            include_objects=("sun",),
+        )
         
-        location: GeoLocation = {
-            "lat": 40.7128,
-            "lon": -74.0060,
-        }
+        location = JplLocation(lat=40.7128, lon=-74.0060)
         
         # Create multiple adapters - they should share loader efficiently
         adapters = [JplEphemerisAdapter() for _ in range(5)]
+        for adapter_instance in adapters[1:]:
+            assert adapter_instance.ts is adapters[0].ts
+            assert adapter_instance.eph is adapters[0].eph
         
         dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         
@@ -5,7 +5,21 @@ from datetime import datetime, timezone
 import os
 
 from crius_ephemeris_core import EphemerisSettings, GeoLocation
-from crius_jpl import create_jpl_adapter, calc_positions, JplEphemerisAdapter
+from crius_jpl import (
+    create_jpl_adapter,
+    calc_positions,
+    set_default_ephemeris_path,
+    JplEphemerisAdapter,
+    EphemerisDownloadError,
+)
+
+
+@pytest.fixture
+def reset_default_ephemeris_path():
+    """Make the default ephemeris path re-read the environment during and after a test."""
+    set_default_ephemeris_path(None)
+    yield
+    set_default_ephemeris_path(None)
 
 
 class TestCreateJplAdapter:
@@ -27,7 +41,7 @@ class TestCreateJplAdapter:
         assert isinstance(adapter, JplEphemerisAdapter)
         assert adapter.ephemeris_path == test_path
 
-    def test_create_adapter_with_env_var(self, monkeypatch, tmp_path):
+    def test_create_adapter_with_env_var(self, monkeypatch, tmp_path, reset_default_ephemeris_path):
         """Test creating adapter respects SWISS_EPHEMERIS_PATH env var."""
         test_path = str(tmp_path / "swisseph")
         test_path.mkdir(parents=True, exist_ok=True)
@@ -36,6 +50,55 @@ class TestCreateJplAdapter:
         adapter = create_jpl_adapter()
         assert adapter.ephemeris_path == test_path
 
+    def test_set_default_ephemeris_path(self, tmp_path, reset_default_ephemeris_path):
+        """Test an explicit default path is used when no path is given."""
+        test_path = str(tmp_path)
+        set_default_ephemeris_path(test_path)
+        
+        adapter = create_jpl_adapter()
+        assert adapter.ephemeris_path == test_path
+
+    def test_create_adapter_is_cached(self):
+        """Test repeated calls share one adapter until the cache is cleared."""
+        adapter1 = create_jpl_adapter()
+        adapter2 = create_jpl_adapter()
+        assert adapter1 is adapter2
+        
+        create_jpl_adapter.cache_clear()
+        adapter3 = create_jpl_adapter()
+        assert adapter3 is not adapter1
+        # The loaded kernel is still shared across adapters
+        assert adapter3.eph is adapter1.eph
+
+    def test_create_adapter_download_error(self, monkeypatch, tmp_path):
+        """Test a failed kernel fetch raises EphemerisDownloadError with the URL."""
+        def failing_fetch(filename):
+            raise OSError("network unreachable")
+        
+        monkeypatch.setattr("crius_jpl.service.fetch_kernel", failing_fetch)
+        
+        with pytest.raises(EphemerisDownloadError) as exc_info:
+            create_jpl_adapter(ephemeris_path=str(tmp_path))
+        assert exc_info.value.url.endswith("de430t.bsp")
+        assert exc_info.value.url in str(exc_info.value)
+
+
+    def test_fetch_kernel_prefers_skyfield_copy(self, monkeypatch, tmp_path):
+        """Test a kernel skyfield already downloaded is used without pooch."""
+        from skyfield.api import Loader
+        from crius_jpl import _data
+        
+        kernel = tmp_path / _data.DE430T_FILENAME
+        kernel.write_bytes(b"")
+        monkeypatch.setattr(_data, "load", Loader(str(tmp_path)))
+        monkeypatch.setattr(_data, "POOCH", None)
+        
+        _data.fetch_kernel.cache_clear()
+        try:
+            assert _data.fetch_kernel(_data.DE430T_FILENAME) == str(kernel)
+        finally:
+            _data.fetch_kernel.cache_clear()
+
 
 class TestCalcPositions:
     """Test calc_positions convenience function."""
@@ -80,3 +143,24 @@ class TestCalcPositions:
         except Exception:
             pytest.skip("JPL ephemeris data not available")
 
+    def test_calc_positions_is_cached(self, sample_settings, sample_location):
+        """Test repeated calls are memoized and return independent copies."""
+        dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        calc_positions.cache_clear()
+        
+        try:
+            positions1 = calc_positions(dt, sample_location, sample_settings)
+        except Exception:
+            pytest.skip("JPL ephemeris data not available")
+        
+        # Same second, equal arguments given as dicts
+        positions2 = calc_positions(
+            dt.replace(microsecond=500000), sample_location.to_dict(), sample_settings.to_dict()
+        )
+        assert positions2 == positions1
+        assert positions2 is not positions1
+        
+        # Mutating a result does not affect the cache
+        positions1["planets"]["sun"]["lon"] = -1.0
+        positions3 = calc_positions(dt, sample_location, sample_settings)
+        assert positions3["planets"]["sun"]["lon"] == positions2["planets"]["sun"]["lon"]
@@ -0,0 +1,115 @@
+"""Tests for date range validation."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from crius_jpl import (
+    JPL_MAX_DATE,
+    JPL_MAX_JD,
+    JPL_MIN_DATE,
+    JPL_MIN_JD,
+    DateRangeError,
+    JplEphemerisAdapter,
+    check_date_range,
+    validate_date_range,
+    validate_jd_range,
+)
+
+
+class TestValidateDateRange:
+    """Test validate_date_range and check_date_range."""
+
+    def test_naive_and_aware_datetimes(self):
+        """Test naive (treated as UTC) and aware datetimes are both accepted."""
+        assert validate_date_range(datetime(2024, 1, 1, 12, 0, 0)) == (True, "")
+        aware = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert validate_date_range(aware) == (True, "")
+
+    def test_bounds_are_utc(self):
+        """Test the range bounds are compared in UTC."""
+        assert validate_date_range(datetime(1550, 1, 1, tzinfo=timezone.utc))[0]
+        assert validate_date_range(datetime(2650, 1, 24, tzinfo=timezone.utc))[0]
+        
+        # 2650-01-24 00:30 at UTC-1 is 01:30 UTC, after the maximum
+        minus_one = timezone(timedelta(hours=-1))
+        assert not validate_date_range(datetime(2650, 1, 24, 0, 30, tzinfo=minus_one))[0]
+
+    def test_out_of_range(self):
+        """Test dates outside the range are rejected."""
+        is_valid, message = validate_date_range(datetime(1500, 1, 1, tzinfo=timezone.utc))
+        assert not is_valid
+        assert "before minimum" in message
+        
+        is_valid, message = validate_date_range(datetime(2700, 1, 1))
+        assert not is_valid
+        assert "after maximum" in message
+
+    def test_check_date_range(self):
+        """Test check_date_range raises or returns False."""
+        dt = datetime(1500, 1, 1, tzinfo=timezone.utc)
+        assert check_date_range(dt, raise_error=False) is False
+        with pytest.raises(DateRangeError):
+            check_date_range(dt)
+
+    def test_validate_jd_range(self):
+        """Test Julian Date bounds are the UTC date bounds converted to TT."""
+        from skyfield.api import load
+        
+        ts = load.timescale(builtin=True)
+        min_utc = JPL_MIN_DATE.replace(tzinfo=timezone.utc)
+        max_utc = JPL_MAX_DATE.replace(tzinfo=timezone.utc)
+        assert JPL_MIN_JD == pytest.approx(ts.from_datetime(min_utc).tt, abs=1e-8)
+        assert JPL_MAX_JD == pytest.approx(ts.from_datetime(max_utc).tt, abs=1e-8)
+        # Inside the DE430t kernel coverage (1549-12-31 to 2650-01-25 TT)
+        assert 2287184.5 < JPL_MIN_JD < JPL_MAX_JD < 2688976.5
+        assert validate_jd_range(2451545.0) == (True, "")
+        assert validate_jd_range(JPL_MIN_JD)[0]
+        assert not validate_jd_range(JPL_MIN_JD - 1)[0]
+        assert not validate_jd_range(JPL_MAX_JD + 1)[0]
+
+
+def test_calc_positions_batch_reports_out_of_range_date(sample_settings):
+    """Test a batch with one out-of-range date raises for that date."""
+    try:
+        adapter = JplEphemerisAdapter()
+    except Exception:
+        pytest.skip("JPL ephemeris data not available")
+    
+    bad_dt = datetime(1500, 1, 1, tzinfo=timezone.utc)
+    dts = [datetime(2024, 1, 1, tzinfo=timezone.utc), bad_dt]
+    with pytest.raises(DateRangeError) as exc_info:
+        adapter.calc_positions_batch(dts, None, sample_settings)
+    assert exc_info.value.date == bad_dt
+    
+    # After the end of the kernel, even though still in 2650
+    with pytest.raises(DateRangeError):
+        adapter.calc_positions(datetime(2650, 6, 1, tzinfo=timezone.utc), None, sample_settings)
+
+
+@pytest.mark.parametrize("dt, in_range", [
+    (datetime(1549, 12, 31, 12, 0, 0, tzinfo=timezone.utc), False),
+    (datetime(1550, 1, 1, 0, 0, 0, tzinfo=timezone.utc), True),
+    (datetime(2650, 1, 24, 0, 0, 0, tzinfo=timezone.utc), True),
+    (datetime(2650, 1, 24, 0, 0, 1, tzinfo=timezone.utc), False),
+])
+def test_adapter_and_check_date_range_agree(dt, in_range, sample_settings):
+    """Test the adapter's TT check and check_date_range accept the same datetimes."""
+    try:
+        adapter = JplEphemerisAdapter()
+    except Exception:
+        pytest.skip("JPL ephemeris data not available")
+    
+    assert check_date_range(dt, raise_error=False) is in_range
+    if in_range:
+        adapter.calc_positions(dt, None, sample_settings)
+    else:
+        with pytest.raises(DateRangeError):
+            adapter.calc_positions(dt, None, sample_settings)
+
+
+def test_date_range_error_message():
+    """Test the lazily built DateRangeError message."""
+    error = DateRangeError("1500-01-01")
+    assert error.date == "1500-01-01"
+    assert str(error).startswith("Date 1500-01-01 is outside the supported JPL DE430t range.")
+    assert "Supported range: 1550-01-01 to 2650-01-24" in str(error)